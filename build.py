@@ -30,6 +30,8 @@ import time
 from pathlib import Path
 from typing import Optional, List, Tuple
 import argparse
+import importlib.util
+from importlib import metadata
 
 
 class BuildManager:
@@ -56,14 +58,9 @@ class BuildManager:
     def log(self, message: str, level: str = "INFO"):
         """로그 출력"""
         timestamp = time.strftime("%H:%M:%S")
-        if level == "ERROR":
-            print(f"[{timestamp}] [ERROR] {message}")
-        elif level == "WARNING":
-            print(f"[{timestamp}] [WARNING] {message}")
-        elif level == "SUCCESS":
-            print(f"[{timestamp}] [SUCCESS] {message}")
-        else:
-            print(f"[{timestamp}] [INFO] {message}")
+        if level not in ("ERROR", "WARNING", "SUCCESS"):
+            level = "INFO"
+        print(f"[{timestamp}] [{level}] {message}")
 
     def get_version_from_config(self) -> str:
         """config.py에서 APP_VERSION 읽기"""
@@ -203,15 +200,18 @@ VSVersionInfo(
 
         self.log(f"Python {python_version.major}.{python_version.minor}.{python_version.micro} 확인됨")
 
-        # PyInstaller 설치 확인
-        try:
-            import PyInstaller
-            self.log(f"PyInstaller {PyInstaller.__version__} 확인됨")
-        except ImportError:
+        # PyInstaller 설치 확인 (모듈을 실제로 import하지 않고 spec/메타데이터만 조회)
+        if importlib.util.find_spec("PyInstaller") is None:
             self.log("PyInstaller가 설치되지 않았습니다.", "ERROR")
             self.log("다음 명령어로 설치하세요: pip install pyinstaller", "ERROR")
             return False
 
+        try:
+            pyinstaller_version = metadata.version("pyinstaller")
+        except metadata.PackageNotFoundError:
+            pyinstaller_version = "(버전 정보 없음)"
+        self.log(f"PyInstaller {pyinstaller_version} 확인됨")
+
         # 필수 파일 확인
         required_files = [
             (self.main_script, "메인 스크립트"),
@@ -402,48 +402,43 @@ VSVersionInfo(
         minutes = int(elapsed_time // 60)
         seconds = int(elapsed_time % 60)
 
-        print()
-        print("=" * 60)
-        print("빌드 완료!")
-        print("=" * 60)
+        # 요약은 줄 단위 print 대신 한 번에 출력 (콘솔 쓰기 횟수 최소화)
+        lines = ["", "=" * 60, "빌드 완료!", "=" * 60]
 
         if self.output_exe.exists():
             stat = self.output_exe.stat()
             size_mb = stat.st_size / 1024 / 1024
 
-            print(f"출력 파일      : {self.output_exe}")
-            print(f"파일 크기      : {size_mb:.1f} MB ({stat.st_size:,} bytes)")
-            print(f"수정 시간      : {time.ctime(stat.st_mtime)}")
-            print(f"빌드 시간      : {minutes:02d}:{seconds:02d}")
+            lines += [
+                f"출력 파일      : {self.output_exe}",
+                f"파일 크기      : {size_mb:.1f} MB ({stat.st_size:,} bytes)",
+                f"수정 시간      : {time.ctime(stat.st_mtime)}",
+                f"빌드 시간      : {minutes:02d}:{seconds:02d}",
+            ]
 
             # 빌드 옵션 정보
-            print()
-            print("빌드 옵션:")
-            print(f"- 디버그 모드  : {'예' if self.debug else '아니오'}")
-            print(f"- 임시 파일 유지: {'예' if self.keep_temp else '아니오'}")
+            lines += [
+                "",
+                "빌드 옵션:",
+                f"- 디버그 모드  : {'예' if self.debug else '아니오'}",
+                f"- 임시 파일 유지: {'예' if self.keep_temp else '아니오'}",
+            ]
 
             # 사용된 파일들
-            print()
-            print("사용된 파일:")
-            print(f"- 메인 스크립트: {self.main_script}")
+            lines += ["", "사용된 파일:", f"- 메인 스크립트: {self.main_script}"]
             if self.icon_file.exists():
-                print(f"- 아이콘 파일  : {self.icon_file}")
+                lines.append(f"- 아이콘 파일  : {self.icon_file}")
             if self.version_file.exists():
-                print(f"- 버전 정보    : {self.version_file}")
+                lines.append(f"- 버전 정보    : {self.version_file}")
             if self.spec_file.exists():
-                print(f"- Spec 파일    : {self.spec_file}")
+                lines.append(f"- Spec 파일    : {self.spec_file}")
 
-        print()
-        print("실행 방법:")
-        print(f"  {self.output_exe}")
-        print()
+        lines += ["", "실행 방법:", f"  {self.output_exe}", ""]
+        print("\n".join(lines))
 
     def build(self) -> bool:
         """전체 빌드 프로세스 실행"""
-        print("=" * 60)
-        print("Simple ToDo 빌드 시작")
-        print("=" * 60)
-        print()
+        print("\n".join(["=" * 60, "Simple ToDo 빌드 시작", "=" * 60, ""]))
 
         try:
             # 1. 요구사항 확인
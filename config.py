@@ -6,6 +6,7 @@ Simple ToDo 애플리케이션 설정
 """
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # 프로젝트 루트 디렉토리 (절대 경로)
@@ -244,12 +245,14 @@ OPACITY_VALUES = {
 ICON_FILE = "simple-todo.ico"
 
 
+@lru_cache(maxsize=None)
 def get_resource_path(relative_path):
     """
     리소스 파일 경로를 반환합니다 (EXE 단독 배포 지원).
 
     개발 환경과 PyInstaller로 빌드된 환경 모두에서 올바른 경로를 반환합니다.
     빌드 환경에서는 _MEIPASS에 추출된 리소스 파일을 사용합니다.
+    실행 중에는 경로가 바뀌지 않으므로 결과를 캐시합니다 (반복 exists() 확인 생략).
 
     Args:
         relative_path: 프로젝트 루트 기준 상대 경로 (Path 또는 str)
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""
+pytest 루트 설정
+
+이 파일이 프로젝트 루트에 있으면 pytest가 루트 디렉토리를 sys.path에 한 번 추가하므로,
+테스트 파일마다 sys.path.insert를 둘 필요 없이 `pytest`만으로 `src`/`config`를 import할 수 있습니다.
+"""
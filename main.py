@@ -61,6 +61,10 @@ else:
     LOG_FILE = LOG_DIR / f"app_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
     TEMP_LOG_DIR = None
 
+# 콘솔 출력 인코딩 오류 방지 (cp949 콘솔에서 이모지 등 출력 시 로그마다 예외 처리가 발생하지 않도록)
+if sys.stdout is not None and hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(errors='replace')
+
 # 로깅 설정 (파일 + 콘솔)
 logging.basicConfig(
     level=logging.INFO,
@@ -426,7 +430,8 @@ def main():
     # 이벤트 루프 실행
     exit_code = app.exec()
 
-    # 정리
+    # 정리 (창이 닫힌 뒤 대기 중인 저장을 마무리하므로 종료 시 UI가 멈추지 않음)
+    repository.flush()
     single_instance.cleanup()
 
     logger.info(f"=== {config.APP_NAME} 종료 (exit_code: {exit_code}) ===")
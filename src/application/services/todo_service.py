@@ -109,13 +109,12 @@ class TodoService:
             ValueError: JSON 파싱 에러
         """
         path = Path(backup_path)
-        if not path.exists():
-            logger.error(f"[TodoService] 백업 파일 없음: {backup_path}")
-            raise FileNotFoundError(f"Backup file not found: {backup_path}")
-
         try:
             with open(path, 'r', encoding='utf-8') as f:
                 return json.load(f)
+        except FileNotFoundError:
+            logger.error(f"[TodoService] 백업 파일 없음: {backup_path}")
+            raise FileNotFoundError(f"Backup file not found: {backup_path}")
         except json.JSONDecodeError as e:
             logger.error(f"[TodoService] JSON 파싱 에러: {backup_path}, {e}")
             raise ValueError(f"Invalid JSON in backup file: {e}")
@@ -173,7 +172,7 @@ class TodoService:
         logger.info(f"[TodoService] TODO 생성 완료: id={new_todo.id.value}, order={next_order}")
         return new_todo
 
-    def update_todo(self, todo_id: str, content: str, due_date: Optional[str] = None) -> None:
+    def update_todo(self, todo_id: str, content: str, due_date: Optional[str] = None) -> Todo:
         """TODO 수정
 
         Args:
@@ -181,6 +180,9 @@ class TodoService:
             content: 새 내용
             due_date: 새 납기일 (ISO 8601 문자열, 선택)
 
+        Returns:
+            Todo: 수정된 TODO (저장 후 다시 조회할 필요 없음)
+
         Raises:
             ValueError: TODO를 찾을 수 없는 경우
         """
@@ -207,6 +209,7 @@ class TodoService:
         self.repository.save(todo)
 
         logger.info(f"[TodoService] TODO 수정 완료: id={todo_id}")
+        return todo
 
     def delete_todo(self, todo_id: str) -> None:
         """TODO 삭제
@@ -587,11 +590,9 @@ class TodoService:
             todos_data = self._extract_todos_data(data)
 
             # 2. backup_todo_id에서 해당 TODO 찾기
-            backup_todo_dict = None
-            for todo_dict in todos_data:
-                if todo_dict.get('id') == backup_todo_id:
-                    backup_todo_dict = todo_dict
-                    break
+            backup_todo_dict = next(
+                (t for t in todos_data if t.get('id') == backup_todo_id), None
+            )
 
             if backup_todo_dict is None:
                 logger.error(f"[TodoService] 백업에서 TODO 찾을 수 없음: id={backup_todo_id}")
@@ -599,11 +600,9 @@ class TodoService:
 
             # 3. subtask_id로 하위할일 찾기
             subtasks_data = backup_todo_dict.get('subtasks', [])
-            source_subtask_dict = None
-            for subtask_dict in subtasks_data:
-                if subtask_dict.get('id') == subtask_id:
-                    source_subtask_dict = subtask_dict
-                    break
+            source_subtask_dict = next(
+                (st for st in subtasks_data if st.get('id') == subtask_id), None
+            )
 
             if source_subtask_dict is None:
                 logger.error(
@@ -48,22 +48,25 @@ class ReorderTodoUseCase:
             ValueError: new_position이 음수인 경우
 
         로직:
-        1. 드래그 시작 시: 현재 표시 순서를 order에 동기화
-        2. 해당 섹션의 TODO들만 조회
+        1. 전체 TODO를 한 번만 조회
+        2. 드래그 시작 시: 현재 표시 순서를 order에 동기화 (메모리)
         3. 이동할 TODO를 찾아 리스트에서 제거
         4. new_position에 삽입
         5. 모든 TODO의 order를 0부터 순차적으로 재설정
-        6. repository.save_all()로 일괄 저장
+        6. repository.save_all()로 한 번만 일괄 저장
         """
         # 유효성 검증
         self._validate_inputs(new_position)
 
+        # 전체 TODO 1회 조회 (이후 단계는 메모리에서 처리)
+        all_todos = self.repository.find_all()
+
         # Order 동기화
-        self._sync_order_with_current_sort(section)
+        section_todos = self._sync_order_with_current_sort(all_todos, section)
 
         # TODO 찾기 및 검증
-        target_todo, target_index, section_todos = self._find_and_validate_todo(
-            todo_id, section
+        target_todo, target_index = self._find_and_validate_todo(
+            todo_id, section, section_todos, all_todos
         )
 
         # 재정렬
@@ -72,7 +75,8 @@ class ReorderTodoUseCase:
         )
 
         # 저장 및 설정 업데이트
-        self._save_reordered_todos(reordered_todos, section)
+        other_section_todos = self._get_section_todos(all_todos, self._get_opposite_section(section))
+        self._save_reordered_todos(reordered_todos, other_section_todos)
 
     def _validate_inputs(self, new_position: int) -> None:
         """입력 유효성 검증
@@ -86,50 +90,45 @@ class ReorderTodoUseCase:
         if new_position < 0:
             raise ValueError(f"new_position must be non-negative, got {new_position}")
 
-    def _sync_order_with_current_sort(self, section: SectionType) -> None:
+    def _sync_order_with_current_sort(self, all_todos: List[Todo], section: SectionType) -> List[Todo]:
         """드래그 시작 시 order 동기화
 
-        현재 표시 순서를 order 필드에 저장합니다.
+        현재 표시 순서를 order 필드에 반영합니다.
+        저장은 재정렬 후 _save_reordered_todos()에서 한 번에 수행합니다.
 
         Args:
+            all_todos: 전체 TODO 리스트
             section: 대상 섹션
-        """
-        all_todos = self.repository.find_all()
 
+        Returns:
+            order가 동기화된 섹션 TODO 리스트
+        """
         # 현재 섹션 TODO 조회
         current_section_todos = self._get_section_todos(all_todos, section)
 
         # Order 동기화
         synced_todos = TodoSortService.sync_order_with_current_sort(current_section_todos)
-
-        # 다른 섹션 TODO 가져오기
-        other_section_todos = self._get_section_todos(all_todos, self._get_opposite_section(section))
-
-        # 저장
-        all_todos_merged = synced_todos + other_section_todos
-        self.repository.save_all(all_todos_merged)
         logger.info(f"[Reorder] Order synchronized before drag in '{section}' section")
+        return synced_todos
 
     def _find_and_validate_todo(
-        self, todo_id: str, section: SectionType
-    ) -> tuple[Todo, int, List[Todo]]:
+        self, todo_id: str, section: SectionType, section_todos: List[Todo], all_todos: List[Todo]
+    ) -> tuple[Todo, int]:
         """TODO 찾기 및 섹션 검증
 
         Args:
             todo_id: 찾을 TODO ID (UUID 문자열)
             section: 대상 섹션
+            section_todos: 대상 섹션 TODO 리스트
+            all_todos: 전체 TODO 리스트 (에러 메시지용)
 
         Returns:
-            (타겟 TODO, 타겟 인덱스, 섹션 TODO 리스트) 튜플
+            (타겟 TODO, 타겟 인덱스) 튜플
 
         Raises:
             ValueError: TODO를 찾을 수 없거나 다른 섹션에 있는 경우
         """
         target_todo_id = TodoId.from_string(todo_id)
-        all_todos = self.repository.find_all()
-
-        # 현재 섹션 TODO 조회
-        section_todos = self._get_section_todos(all_todos, section)
 
         # 타겟 TODO 찾기
         target_todo: Todo | None = None
@@ -145,7 +144,7 @@ class ReorderTodoUseCase:
         if target_todo is None:
             self._raise_todo_not_found_error(todo_id, section, all_todos, target_todo_id)
 
-        return target_todo, target_index, section_todos
+        return target_todo, target_index
 
     def _reorder_in_section(
         self,
@@ -181,18 +180,13 @@ class ReorderTodoUseCase:
 
         return section_todos
 
-    def _save_reordered_todos(self, section_todos: List[Todo], section: SectionType) -> None:
+    def _save_reordered_todos(self, section_todos: List[Todo], other_section_todos: List[Todo]) -> None:
         """재정렬된 TODO 저장 및 설정 업데이트
 
         Args:
             section_todos: 재정렬된 섹션 TODO 리스트
-            section: 대상 섹션
+            other_section_todos: 다른 섹션 TODO 리스트 (변경 없음)
         """
-        all_todos = self.repository.find_all()
-
-        # 다른 섹션 TODO 가져오기
-        other_section_todos = self._get_section_todos(all_todos, self._get_opposite_section(section))
-
         # 전체 TODO 병합 후 저장
         all_todos_final = section_todos + other_section_todos
         self.repository.save_all(all_todos_final)
@@ -2,6 +2,7 @@
 """TodoSortService - TODO 정렬 서비스"""
 
 import logging
+from datetime import datetime
 from typing import List, Literal
 from ..entities.todo import Todo
 
@@ -44,13 +45,12 @@ class TodoSortService:
         # MANUAL 모드: order 필드만으로 정렬 (납기일 무시)
         if sort_order == "manual":
             sorted_todos = sorted(todos, key=lambda t: t.order)
-            logger.debug(f"[Manual Order] Sorted {len(sorted_todos)} todos by order field only")
+            logger.debug("[Manual Order] Sorted %d todos by order field only", len(sorted_todos))
             return sorted_todos
 
         # TODAY_FIRST 모드: 오늘 납기 우선 정렬
         if sort_order == "today_first":
             # 1. 납기일이 오늘인 TODO 분리
-            from datetime import datetime
             today = datetime.now()
             todos_today = [
                 todo for todo in todos
@@ -71,9 +71,8 @@ class TodoSortService:
 
             # 5. 결합: 오늘 → 납기일 있음 → 납기일 없음
             logger.debug(
-                f"[Today First] Sorted: today={len(todos_today)}, "
-                f"with_due_date={len(todos_with_due_date)}, "
-                f"without_due_date={len(todos_without_due_date)}"
+                "[Today First] Sorted: today=%d, with_due_date=%d, without_due_date=%d",
+                len(todos_today), len(todos_with_due_date), len(todos_without_due_date)
             )
             return todos_today + todos_with_due_date + todos_without_due_date
 
@@ -87,14 +86,14 @@ class TodoSortService:
             todos_with_due_date.sort(
                 key=lambda t: (t.due_date.value, t.content.value)  # type: ignore
             )
-            logger.debug(f"[Due Date Asc] Sorted {len(todos_with_due_date)} todos by dueDate, content")
+            logger.debug("[Due Date Asc] Sorted %d todos by dueDate, content", len(todos_with_due_date))
         else:  # dueDate_desc
             # 늦은순: 날짜 내림차순, 같으면 내용 오름차순
             todos_with_due_date.sort(
                 key=lambda t: (t.due_date.value, t.content.value),  # type: ignore
                 reverse=True
             )
-            logger.debug(f"[Due Date Desc] Sorted {len(todos_with_due_date)} todos by dueDate, content")
+            logger.debug("[Due Date Desc] Sorted %d todos by dueDate, content", len(todos_with_due_date))
 
         # 납기일 없는 항목 정렬 (내용 순)
         todos_without_due_date.sort(key=lambda t: t.content.value)
@@ -146,7 +145,7 @@ class TodoSortService:
             logger.debug("[Order Sync] Empty list, returning as-is")
             return todos
 
-        logger.debug(f"[Order Sync] Starting sync for {len(todos)} todos")
+        logger.debug("[Order Sync] Starting sync for %d todos", len(todos))
 
         updated_count = 0
 
@@ -156,10 +155,9 @@ class TodoSortService:
                 # order 변경 (mutable 방식)
                 todo.change_order(new_order)
                 updated_count += 1
-                logger.debug(
-                    f"[Order Sync] Updated: {str(todo.id)[:8]}... "
-                    f"{old_order} -> {new_order}"
-                )
+                # 디버그 로그가 꺼져 있으면 ID 문자열 변환 생략 (루프 내 불필요한 포맷팅 방지)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[Order Sync] Updated: %s... %d -> %d", str(todo.id)[:8], old_order, new_order)
 
         if updated_count == 0:
             logger.debug("[Order Sync] No changes needed")
@@ -2,9 +2,49 @@
 """AppVersion Value Object - Semantic Versioning 지원"""
 
 from dataclasses import dataclass
-from typing import Union
+from functools import lru_cache
+from typing import Tuple, Union
 import re
 
+# major.minor 또는 major.minor.patch
+_VERSION_PATTERN = re.compile(r'^(\d+)\.(\d+)(?:\.(\d+))?$')
+
+
+@lru_cache(maxsize=64)
+def _parse_version(version_str: str) -> Tuple[int, int, int]:
+    """버전 문자열을 (major, minor, patch)로 파싱합니다 (결과 캐싱).
+
+    같은 문자열(config.APP_VERSION, 건너뛴 버전, 릴리스 태그)이
+    반복해서 파싱되므로 결과를 캐싱합니다. 실패(ValueError)는 캐싱되지 않습니다.
+
+    Args:
+        version_str: 버전 문자열
+
+    Returns:
+        Tuple[int, int, int]: (major, minor, patch)
+
+    Raises:
+        ValueError: 유효하지 않은 버전 형식인 경우
+    """
+    # "v" 접두사 제거
+    clean_version = version_str.strip().lower()
+    if clean_version.startswith('v'):
+        clean_version = clean_version[1:]
+
+    # 정규식으로 버전 파싱 (major.minor 또는 major.minor.patch)
+    match = _VERSION_PATTERN.match(clean_version)
+
+    if not match:
+        raise ValueError(
+            f"유효하지 않은 버전 형식입니다: {version_str} "
+            f"(형식: 'major.minor.patch' 또는 'major.minor')"
+        )
+
+    major = int(match.group(1))
+    minor = int(match.group(2))
+    patch = int(match.group(3)) if match.group(3) else 0
+    return (major, minor, patch)
+
 
 @dataclass(frozen=True)
 class AppVersion:
@@ -54,25 +94,7 @@ class AppVersion:
         if not version_str or not isinstance(version_str, str):
             raise ValueError(f"버전 문자열이 필요합니다: {version_str}")
 
-        # "v" 접두사 제거
-        clean_version = version_str.strip().lower()
-        if clean_version.startswith('v'):
-            clean_version = clean_version[1:]
-
-        # 정규식으로 버전 파싱 (major.minor 또는 major.minor.patch)
-        pattern = r'^(\d+)\.(\d+)(?:\.(\d+))?$'
-        match = re.match(pattern, clean_version)
-
-        if not match:
-            raise ValueError(
-                f"유효하지 않은 버전 형식입니다: {version_str} "
-                f"(형식: 'major.minor.patch' 또는 'major.minor')"
-            )
-
-        major = int(match.group(1))
-        minor = int(match.group(2))
-        patch = int(match.group(3)) if match.group(3) else 0
-
+        major, minor, patch = _parse_version(version_str)
         return cls(major=major, minor=minor, patch=patch)
 
     def __str__(self) -> str:
@@ -9,7 +9,7 @@ from typing import Literal
 DueDateStatus = Literal["overdue_severe", "overdue_moderate", "overdue_mild", "today", "upcoming", "normal"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DueDate:
     """Todo의 납기일을 나타내는 Value Object
 
@@ -88,6 +88,23 @@ class DueDate:
         else:
             return f"{days}일 남음"
 
+    def display_info(self, current_date: datetime | None = None) -> tuple[str, DueDateStatus]:
+        """표시 텍스트와 상태를 한 번에 계산합니다.
+
+        현재 시각을 한 번만 조회해 format_display_text()와 calculate_status()에
+        함께 사용합니다.
+
+        Args:
+            current_date: 기준 날짜 (None일 경우 현재 시각 사용)
+
+        Returns:
+            tuple: (표시 텍스트, 상태)
+        """
+        if current_date is None:
+            current_date = datetime.now()
+
+        return (self.format_display_text(current_date), self.calculate_status(current_date))
+
     @staticmethod
     def from_string(date_str: str) -> 'DueDate':
         """문자열로부터 DueDate 인스턴스를 생성합니다.
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from uuid import UUID, uuid4
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TodoId:
     """Todo의 고유 식별자를 나타내는 Value Object
 
@@ -4,13 +4,38 @@
 import json
 import shutil
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 import logging
 
+from ..utils.json_io import read_json
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 파싱 결과를 캐시할 최대 백업 파일 수
+BACKUP_JSON_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=BACKUP_JSON_CACHE_SIZE)
+def _read_backup_json(path: Path, mtime_ns: int, size: int) -> Any:
+    """백업 파일을 파싱합니다 (파일 경로 + 수정 시각 + 크기 기준 캐시).
+
+    백업 목록 표시(유효성 검증)와 내용 검색이 같은 파일을 반복해서 읽으므로,
+    파일이 바뀌지 않았다면 이전 파싱 결과를 재사용합니다.
+    반환값은 공유되므로 호출 측에서 수정하면 안 됩니다.
+
+    Args:
+        path: 백업 파일 경로
+        mtime_ns: 파일 수정 시각 (캐시 키)
+        size: 파일 크기 (캐시 키)
+
+    Returns:
+        Any: 로드된 JSON 데이터 (dict 또는 list)
+    """
+    return read_json(path)
+
 
 class BackupService:
     """데이터 백업 및 복구를 담당하는 서비스
@@ -120,9 +145,8 @@ class BackupService:
             return False
 
         try:
-            # 백업 파일 유효성 검증
-            with open(backup_path, 'r', encoding='utf-8') as f:
-                json.load(f)  # JSON 파싱 테스트
+            # 백업 파일 유효성 검증 (JSON 파싱 테스트)
+            read_json(backup_path)
 
             # 원본 파일에 복사
             shutil.copy2(backup_path, self.data_file)
@@ -195,8 +219,8 @@ class BackupService:
         Raises:
             json.JSONDecodeError: JSON 파싱 에러
         """
-        with open(backup_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        stat = backup_path.stat()
+        return _read_backup_json(backup_path, stat.st_mtime_ns, stat.st_size)
 
     def _extract_todos_data(self, data: Any) -> list:
         """신규/레거시 포맷에서 TODO 데이터를 추출합니다 (공통 메서드).
@@ -228,11 +252,8 @@ class BackupService:
         Returns:
             bool: 유효한 백업 파일 여부
         """
-        if not backup_path.exists():
-            return False
-
         try:
-            # 공통 메서드 재사용
+            # 공통 메서드 재사용 (exists() 확인 없이 바로 읽기)
             data = self._load_backup_json(backup_path)
 
             # 기본 구조 검증
@@ -245,6 +266,9 @@ class BackupService:
             else:
                 return False
 
+        except FileNotFoundError:
+            return False
+
         except Exception as e:
             logger.error(f"Backup verification failed for {backup_path}: {e}")
             return False
@@ -290,11 +314,12 @@ class BackupService:
                     # 파일명 형식이 다르면 포함 (레거시 백업 등)
                     pass
 
+            stat = path.stat()
             result.append({
                 'filename': filename,
                 'path': path,
-                'size': path.stat().st_size,
-                'created': path.stat().st_mtime,
+                'size': stat.st_size,
+                'created': stat.st_mtime,
                 'is_valid': self.verify_backup(path)  # 기존 메서드 재사용
             })
 
@@ -316,20 +341,18 @@ class BackupService:
         # 도메인 엔티티 import (메서드 내부에서)
         from ...domain.entities.todo import Todo
 
-        # 1. 파일 존재 확인
-        if not backup_path.exists():
-            raise FileNotFoundError(f"Backup file not found: {backup_path}")
-
-        # 2. JSON 로드 (공통 메서드 재사용)
+        # 1. JSON 로드 (공통 메서드 재사용, 파일이 없으면 stat에서 FileNotFoundError)
         try:
             data = self._load_backup_json(backup_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Backup file not found: {backup_path}")
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in backup file: {e}")
 
-        # 3. TODO 목록 추출 (공통 메서드 재사용)
+        # 2. TODO 목록 추출 (공통 메서드 재사용)
         todos_data = self._extract_todos_data(data)
 
-        # 4. Todo 엔티티 리스트 생성
+        # 3. Todo 엔티티 리스트 생성
         todos = []
         for todo_dict in todos_data:
             try:
@@ -1,21 +1,25 @@
 # -*- coding: utf-8 -*-
 """GitHub Release Repository - GitHub API로부터 릴리스 정보 가져오기"""
 
+import importlib.util
 import logging
+import time
 from typing import Optional
 from datetime import datetime
 
-try:
-    import requests
-except ImportError:
-    requests = None
-
 from ...domain.entities.release import Release
 from ...domain.value_objects.app_version import AppVersion
+from ..utils.json_io import loads_json
 
 
 logger = logging.getLogger(__name__)
 
+# GitHub API 요청 헤더 (세션 기본 헤더로 사용)
+GITHUB_API_HEADERS = {
+    'Accept': 'application/vnd.github.v3+json',
+    'User-Agent': 'SimpleTodo-AutoUpdater/1.0'
+}
+
 
 class GitHubReleaseRepository:
     """GitHub Releases API를 통해 최신 릴리스 정보를 가져오는 Repository
@@ -27,6 +31,7 @@ class GitHubReleaseRepository:
         repo_owner: GitHub 저장소 소유자
         repo_name: GitHub 저장소 이름
         timeout: API 요청 타임아웃 (초)
+        session: 요청 간 연결(keep-alive)을 재사용하는 HTTP 세션 (첫 요청 시 생성)
 
     Examples:
         >>> repo = GitHubReleaseRepository("gyh214", "simple-todo")
@@ -35,6 +40,9 @@ class GitHubReleaseRepository:
         ...     print(f"최신 버전: {release.version}")
     """
 
+    # 조회 성공 결과 재사용 시간 (초) - 연속 확인 시 API 호출/rate limit 소모 방지
+    RELEASE_CACHE_TTL = 180
+
     def __init__(self, repo_owner: str, repo_name: str, timeout: int = 10):
         """GitHubReleaseRepository 초기화
 
@@ -51,7 +59,7 @@ class GitHubReleaseRepository:
             raise ValueError("repo_owner는 비어있을 수 없습니다")
         if not repo_name or not repo_name.strip():
             raise ValueError("repo_name은 비어있을 수 없습니다")
-        if requests is None:
+        if importlib.util.find_spec("requests") is None:
             raise ImportError(
                 "requests 라이브러리가 설치되지 않았습니다. "
                 "'pip install requests'를 실행하세요."
@@ -63,6 +71,13 @@ class GitHubReleaseRepository:
 
         self.api_url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/releases/latest"
 
+        # 세션 재사용: 재확인 시 TCP/TLS 연결을 다시 맺지 않음 (첫 요청 시 생성)
+        self.session = None
+
+        # 마지막 조회 성공 결과 (Release, time.monotonic() 시각)
+        self._cached_release: Optional[Release] = None
+        self._cached_at: float = 0.0
+
         logger.info(
             f"GitHubReleaseRepository 초기화: {self.repo_owner}/{self.repo_name}"
         )
@@ -83,19 +98,27 @@ class GitHubReleaseRepository:
             - 404 Not Found (릴리스가 없는 경우)
             - SimpleTodo.exe 에셋이 없는 경우
             - JSON 파싱 오류
+
+            마지막 성공 결과는 RELEASE_CACHE_TTL 동안 재사용합니다 (실패는 캐싱하지 않음).
         """
+        if (self._cached_release is not None
+                and time.monotonic() - self._cached_at < self.RELEASE_CACHE_TTL):
+            logger.info(f"최신 릴리스 캐시 사용: {self._cached_release.version}")
+            return self._cached_release
+
+        # requests(urllib3/ssl 포함)는 실제 요청 시점에 로드 (앱 시작 시간 단축)
+        import requests
+
+        if self.session is None:
+            self.session = requests.Session()
+            self.session.headers.update(GITHUB_API_HEADERS)
+
         try:
             logger.info(f"GitHub API 요청: {self.api_url}")
 
             # GitHub API 요청
-            headers = {
-                'Accept': 'application/vnd.github.v3+json',
-                'User-Agent': 'SimpleTodo-AutoUpdater/1.0'
-            }
-
-            response = requests.get(
+            response = self.session.get(
                 self.api_url,
-                headers=headers,
                 timeout=self.timeout
             )
 
@@ -114,8 +137,8 @@ class GitHubReleaseRepository:
                 )
                 return None
 
-            # JSON 파싱
-            data = response.json()
+            # JSON 파싱 (응답 바이트를 바로 파싱)
+            data = loads_json(response.content)
 
             # Release 엔티티로 변환
             release = self._parse_release_response(data)
@@ -125,6 +148,8 @@ class GitHubReleaseRepository:
                     f"최신 릴리스 조회 성공: {release.version} "
                     f"({release.format_file_size()})"
                 )
+                self._cached_release = release
+                self._cached_at = time.monotonic()
             else:
                 logger.warning("SimpleTodo.exe 에셋을 찾을 수 없습니다")
 
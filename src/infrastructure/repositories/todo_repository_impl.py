@@ -15,6 +15,7 @@ from ...domain.value_objects.todo_id import TodoId
 from ..file_system.backup_service import BackupService
 from ..file_system.migration_service import DataMigrationService
 from ..utils.debounce_manager import DebounceManager
+from ..utils.json_io import read_json, dumps_json
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -39,6 +40,9 @@ class TodoRepositoryImpl(ITodoRepository):
         self.migration_service = DataMigrationService()
         self._lock = RLock()  # 재진입 가능한 Lock (스레드 안전성 + 중첩 호출 지원)
         self._data_cache: Optional[Dict[str, Any]] = None
+        # id → todos 리스트 위치 인덱스 (어떤 리스트 기준으로 만들었는지 함께 보관)
+        self._todo_index: Dict[str, int] = {}
+        self._todo_index_source: Optional[List[Dict[str, Any]]] = None
 
         # 비동기 배치 저장을 위한 debounce 관련 변수
         self._pending_data: Optional[Dict[str, Any]] = None
@@ -85,11 +89,24 @@ class TodoRepositoryImpl(ITodoRepository):
         Returns:
             Optional[Todo]: TODO 엔티티 (없으면 None)
         """
-        todos = self.find_all()
-        for todo in todos:
-            if str(todo.id) == str(todo_id):
-                return todo
-        return None
+        target_id = str(todo_id)
+        with self._lock:
+            data = self._load_data()
+
+            todos_data = data.get("todos", [])
+
+            # id 인덱스로 원본 딕셔너리를 찾고, 일치하는 1개만 엔티티로 변환
+            # (전체 TODO를 순회/from_dict 하지 않음)
+            index = self._get_todo_index(todos_data).get(target_id)
+            if index is None:
+                return None
+
+            todo_dict = todos_data[index]
+            try:
+                return Todo.from_dict(todo_dict)
+            except Exception as e:
+                logger.error(f"Failed to deserialize todo: {todo_dict}, {e}")
+                return None
 
     def save(self, todo: Todo) -> None:
         """TODO를 저장합니다 (생성 또는 업데이트).
@@ -101,12 +118,10 @@ class TodoRepositoryImpl(ITodoRepository):
             data = self._load_data()
             todos_data = data.get("todos", [])
 
-            # 기존 TODO 찾기
-            existing_index = None
-            for i, todo_dict in enumerate(todos_data):
-                if todo_dict.get("id") == str(todo.id):
-                    existing_index = i
-                    break
+            # 기존 TODO 찾기 (id 인덱스 사용)
+            target_id = str(todo.id)
+            todo_index = self._get_todo_index(todos_data)
+            existing_index = todo_index.get(target_id)
 
             # 업데이트 또는 추가
             todo_dict = todo.to_dict()
@@ -114,6 +129,7 @@ class TodoRepositoryImpl(ITodoRepository):
                 todos_data[existing_index] = todo_dict
             else:
                 todos_data.append(todo_dict)
+                todo_index[target_id] = len(todos_data) - 1
 
             data["todos"] = todos_data
             self._save_data(data)
@@ -174,6 +190,34 @@ class TodoRepositoryImpl(ITodoRepository):
             data["settings"].update(settings)
             self._save_data(data)
 
+    def flush(self) -> None:
+        """대기 중인 debounce 저장을 즉시 실행합니다.
+
+        애플리케이션 종료 시 호출하여 300ms 타이머가 만료되기 전에
+        이벤트 루프가 끝나도 마지막 변경 사항이 유실되지 않도록 합니다.
+        """
+        self._save_debouncer.flush()
+
+    def _get_todo_index(self, todos_data: List[Dict[str, Any]]) -> Dict[str, int]:
+        """todos 리스트의 id → 위치 인덱스를 반환합니다.
+
+        인덱스는 마지막으로 만든 리스트 객체 기준으로 유지되며,
+        delete/save_all/로드 등으로 리스트가 교체되면 다시 생성합니다.
+
+        Args:
+            todos_data: 원본 TODO 딕셔너리 리스트
+
+        Returns:
+            Dict[str, int]: TODO id 문자열 → 리스트 위치
+        """
+        if self._todo_index_source is not todos_data:
+            index: Dict[str, int] = {}
+            for i, todo_dict in enumerate(todos_data):
+                index.setdefault(todo_dict.get("id"), i)
+            self._todo_index = index
+            self._todo_index_source = todos_data
+        return self._todo_index
+
     def _ensure_data_file_exists(self) -> None:
         """데이터 파일이 존재하지 않으면 기본값으로 생성합니다."""
         if not self.data_file.exists():
@@ -192,8 +236,7 @@ class TodoRepositoryImpl(ITodoRepository):
             }
 
             try:
-                with open(self.data_file, 'w', encoding='utf-8') as f:
-                    json.dump(default_data, f, ensure_ascii=False, indent=2)
+                self.data_file.write_bytes(dumps_json(default_data))
                 logger.info(f"Created default data file: {self.data_file}")
             except Exception as e:
                 logger.error(f"Failed to create data file: {e}")
@@ -213,8 +256,7 @@ class TodoRepositoryImpl(ITodoRepository):
             return self._data_cache
 
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = read_json(self.data_file)
 
             # 레거시 포맷 감지 및 마이그레이션
             if self.migration_service.detect_legacy_format(data):
@@ -372,14 +414,13 @@ class TodoRepositoryImpl(ITodoRepository):
         """
         # 임시 파일에 저장
         with tempfile.NamedTemporaryFile(
-            mode='w',
-            encoding='utf-8',
+            mode='wb',
             delete=False,
             dir=self.data_file.parent,
             prefix='.tmp_',
             suffix='.json'
         ) as tmp_file:
-            json.dump(data, tmp_file, ensure_ascii=False, indent=2)
+            tmp_file.write(dumps_json(data))
             tmp_path = Path(tmp_file.name)
 
         try:
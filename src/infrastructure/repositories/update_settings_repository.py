@@ -11,6 +11,7 @@ from datetime import datetime
 from threading import RLock
 
 from ...domain.value_objects.app_version import AppVersion
+from ..utils.json_io import read_json, dumps_json
 
 
 logger = logging.getLogger(__name__)
@@ -50,6 +51,10 @@ class UpdateSettingsRepository:
         self.data_file_path = Path(data_file_path)
         self._lock = RLock()  # 스레드 안전성
 
+        # updateSettings 읽기 캐시 (파일 (mtime_ns, size)가 같으면 재파싱하지 않음)
+        self._settings_cache: dict = {}
+        self._settings_cache_key: Optional[tuple] = None
+
         logger.info(f"UpdateSettingsRepository 초기화: {self.data_file_path}")
 
     def get_last_check_time(self) -> Optional[datetime]:
@@ -59,8 +64,7 @@ class UpdateSettingsRepository:
             Optional[datetime]: 마지막 체크 시간 (없으면 None)
         """
         with self._lock:
-            data = self._load_data()
-            update_settings = data.get('updateSettings', {})
+            update_settings = self._load_update_settings()
             last_check_str = update_settings.get('lastUpdateCheck')
 
             if not last_check_str:
@@ -110,8 +114,7 @@ class UpdateSettingsRepository:
             Optional[AppVersion]: 건너뛴 버전 (없으면 None)
         """
         with self._lock:
-            data = self._load_data()
-            update_settings = data.get('updateSettings', {})
+            update_settings = self._load_update_settings()
             skipped_version_str = update_settings.get('skippedVersion')
 
             if not skipped_version_str:
@@ -162,8 +165,7 @@ class UpdateSettingsRepository:
             bool: 자동 체크 활성화 여부 (기본값: True)
         """
         with self._lock:
-            data = self._load_data()
-            update_settings = data.get('updateSettings', {})
+            update_settings = self._load_update_settings()
 
             # 기본값: True (자동 체크 활성화)
             return update_settings.get('autoCheckEnabled', True)
@@ -206,18 +208,9 @@ class UpdateSettingsRepository:
         Note:
             파일이 없거나 파싱 오류 시 기본 구조를 반환합니다.
         """
-        if not self.data_file_path.exists():
-            logger.warning(f"데이터 파일이 없습니다: {self.data_file_path}")
-            return {
-                'version': '1.0',
-                'settings': {},
-                'updateSettings': {},
-                'todos': []
-            }
-
         try:
-            with open(self.data_file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # exists() 확인 없이 바로 읽기 (없으면 FileNotFoundError로 처리, stat 1회 절약)
+            data = read_json(self.data_file_path)
 
             # 기본 구조 보장
             if not isinstance(data, dict):
@@ -231,6 +224,15 @@ class UpdateSettingsRepository:
 
             return data
 
+        except FileNotFoundError:
+            logger.warning(f"데이터 파일이 없습니다: {self.data_file_path}")
+            return {
+                'version': '1.0',
+                'settings': {},
+                'updateSettings': {},
+                'todos': []
+            }
+
         except json.JSONDecodeError as e:
             logger.error(f"JSON 파싱 오류: {e}")
             return {
@@ -249,6 +251,27 @@ class UpdateSettingsRepository:
                 'todos': []
             }
 
+    def _load_update_settings(self) -> dict:
+        """읽기 전용 updateSettings를 반환합니다 (파일이 바뀌지 않았으면 캐시 사용).
+
+        업데이트 체크 한 번에 여러 getter가 호출되므로, stat 1회로 변경 여부만 확인하고
+        data.json 전체(todos 포함)를 다시 읽고 파싱하지 않습니다.
+
+        Returns:
+            dict: updateSettings 딕셔너리 (호출자는 수정하지 않아야 함)
+        """
+        try:
+            stat = self.data_file_path.stat()
+        except OSError:
+            # 파일 없음 등은 기존 로드 경로에서 로그/기본값 처리
+            return self._load_data().get('updateSettings', {})
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        if key != self._settings_cache_key:
+            self._settings_cache = self._load_data().get('updateSettings', {})
+            self._settings_cache_key = key
+        return self._settings_cache
+
     def _save_data(self, data: dict) -> bool:
         """data.json을 원자적으로 저장합니다.
 
@@ -266,13 +289,12 @@ class UpdateSettingsRepository:
 
             # 임시 파일에 쓰기
             with tempfile.NamedTemporaryFile(
-                mode='w',
-                encoding='utf-8',
+                mode='wb',
                 delete=False,
                 dir=self.data_file_path.parent,
                 suffix='.tmp'
             ) as temp_file:
-                json.dump(data, temp_file, indent=2, ensure_ascii=False)
+                temp_file.write(dumps_json(data))
                 temp_path = Path(temp_file.name)
 
             # 원자적 교체
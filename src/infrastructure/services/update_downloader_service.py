@@ -1,17 +1,13 @@
 # -*- coding: utf-8 -*-
 """Update Downloader Service - HTTP로 exe 파일 다운로드 및 진행률 추적"""
 
+import importlib.util
 import logging
 import tempfile
 from pathlib import Path
 from typing import Optional, Callable
 import time
 
-try:
-    import requests
-except ImportError:
-    requests = None
-
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +44,9 @@ class UpdateDownloaderService:
     # 최대 재시도 횟수
     MAX_RETRIES = 3
 
+    # 재시도 대기 기본 시간 (초, 지수 백오프의 시작값 / 0이면 대기 없음)
+    RETRY_BACKOFF_BASE = 1
+
     def __init__(self, download_dir: Optional[Path] = None):
         """UpdateDownloaderService 초기화
 
@@ -57,7 +56,7 @@ class UpdateDownloaderService:
         Raises:
             ImportError: requests 라이브러리가 설치되지 않은 경우
         """
-        if requests is None:
+        if importlib.util.find_spec("requests") is None:
             raise ImportError(
                 "requests 라이브러리가 설치되지 않았습니다. "
                 "'pip install requests'를 실행하세요."
@@ -132,8 +131,8 @@ class UpdateDownloaderService:
                 )
 
             # 재시도 전 대기 (지수 백오프: 1초, 2초, 4초)
-            if attempt < self.MAX_RETRIES:
-                wait_time = 2 ** (attempt - 1)
+            if attempt < self.MAX_RETRIES and self.RETRY_BACKOFF_BASE > 0:
+                wait_time = self.RETRY_BACKOFF_BASE * 2 ** (attempt - 1)
                 logger.info(f"{wait_time}초 후 재시도...")
                 time.sleep(wait_time)
 
@@ -156,6 +155,9 @@ class UpdateDownloaderService:
         Returns:
             bool: 성공 여부
         """
+        # requests는 실제 다운로드 시점에 로드 (앱 시작 시간 단축)
+        import requests
+
         # 임시 파일 경로 (dest_path.tmp)
         temp_path = dest_path.with_suffix(dest_path.suffix + '.tmp')
 
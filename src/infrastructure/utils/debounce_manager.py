@@ -85,7 +85,7 @@ class DebounceManager:
         self._timer: Optional[QTimer] = None
         self._pending_data: Any = None
 
-        logger.debug(f"DebounceManager initialized: delay={delay_ms}ms, callback={callback.__name__}")
+        logger.debug("DebounceManager initialized: delay=%dms, callback=%s", delay_ms, callback.__name__)
 
     def schedule(self, data: Any = None) -> None:
         """Debounce 실행 예약
@@ -102,24 +102,25 @@ class DebounceManager:
 
         Implementation Details:
             1. pending_data 업데이트 (마지막 값 유지)
-            2. 기존 타이머가 active면 중지
-            3. 새 타이머 생성 및 시작 (delay_ms)
+            2. 타이머가 없으면 최초 1회 생성 (이후 재사용)
+            3. 타이머 (재)시작 - active 상태면 start()가 기존 예약을 대체
             4. delay_ms 후 _execute_callback() 호출
         """
         # pending 데이터 업데이트 (마지막 값만 유지)
         self._pending_data = data
 
-        # 기존 타이머가 있으면 중지 (타이머 재시작)
-        if self._timer and self._timer.isActive():
-            self._timer.stop()
-            logger.debug(f"Debounce timer restarted: delay={self._delay_ms}ms")
+        # 단일 타이머 재사용 (호출마다 QTimer를 새로 만들지 않음)
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self._execute_callback)
+
+        if self._timer.isActive():
+            logger.debug("Debounce timer restarted: delay=%dms", self._delay_ms)
         else:
-            logger.debug(f"Debounce timer started: delay={self._delay_ms}ms")
+            logger.debug("Debounce timer started: delay=%dms", self._delay_ms)
 
-        # 새 타이머 생성 및 시작
-        self._timer = QTimer()
-        self._timer.setSingleShot(True)
-        self._timer.timeout.connect(self._execute_callback)
+        # start()는 실행 중인 타이머를 중지 후 다시 시작함
         self._timer.start(self._delay_ms)
 
     def cancel(self) -> None:
@@ -140,6 +141,18 @@ class DebounceManager:
         else:
             logger.debug("No active debounce timer to cancel")
 
+    def flush(self) -> None:
+        """예약된 실행을 즉시 수행
+
+        타이머가 대기 중이면 중지하고 콜백을 바로 실행합니다.
+        종료 직전처럼 타이머 만료를 기다릴 수 없을 때 사용합니다.
+        예약이 없으면 아무 동작도 하지 않습니다.
+        """
+        if self._timer and self._timer.isActive():
+            self._timer.stop()
+            logger.debug("Debounce timer flushed")
+            self._execute_callback()
+
     def is_active(self) -> bool:
         """타이머가 활성화되어 있는지 확인
 
@@ -180,7 +193,7 @@ class DebounceManager:
             data = self._pending_data
             self._pending_data = None
 
-            logger.debug(f"Executing debounced callback with data: {data}")
+            logger.debug("Executing debounced callback with data: %s", data)
 
             try:
                 self._callback(data)
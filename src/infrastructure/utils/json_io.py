@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+JSON 파일 입출력 유틸리티
+
+data.json 읽기/쓰기를 바이트 단위로 처리합니다.
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 동작합니다.
+
+Usage:
+    data = read_json(path)
+    data = loads_json(response.content)
+    tmp_file.write(dumps_json(data))
+"""
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def read_json(path: Path) -> Any:
+    """JSON 파일을 바이트로 한 번에 읽어 파싱합니다.
+
+    텍스트 모드 디코딩을 거치지 않고 UTF-8 바이트를 바로 파싱합니다.
+
+    Args:
+        path: JSON 파일 경로
+
+    Returns:
+        Any: 파싱된 데이터
+
+    Raises:
+        json.JSONDecodeError: JSON 파싱 에러 (orjson.JSONDecodeError도 하위 클래스)
+    """
+    return loads_json(path.read_bytes())
+
+
+def loads_json(raw: bytes) -> Any:
+    """UTF-8 JSON 바이트를 파싱합니다 (HTTP 응답 본문 등).
+
+    Args:
+        raw: JSON 바이트
+
+    Returns:
+        Any: 파싱된 데이터
+
+    Raises:
+        json.JSONDecodeError: JSON 파싱 에러 (orjson.JSONDecodeError도 하위 클래스)
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps_json(data: Any) -> bytes:
+    """데이터를 들여쓰기 2칸의 UTF-8 JSON 바이트로 직렬화합니다.
+
+    json.dump(..., ensure_ascii=False, indent=2)와 같은 형식을 생성합니다.
+
+    Args:
+        data: 직렬화할 데이터
+
+    Returns:
+        bytes: UTF-8로 인코딩된 JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
@@ -389,6 +389,23 @@ class BackupManagerDialog(QDialog):
 
         return display_text
 
+    def reset_state(self):
+        """재사용 전 입력 상태 초기화 (새로 생성한 다이얼로그와 같은 상태로)
+
+        검색어, 일수 필터, TODO 미리보기, 선택 탭을 기본값으로 되돌립니다.
+        목록 데이터는 load_data()에서 다시 로드합니다.
+        """
+        self.tab_widget.setCurrentIndex(0)
+        self.backup_search_input.clear()
+        self.search_input.clear()
+        self.todo_preview_list.clear()
+
+        # 일수 필터 복원 (textChanged로 인한 중복 로드 방지)
+        self.backup_display_days = config.BACKUP_DISPLAY_DAYS
+        self.days_input.blockSignals(True)
+        self.days_input.setText(str(self.backup_display_days))
+        self.days_input.blockSignals(False)
+
     def load_data(self):
         """데이터 로드"""
         self._load_backup_list()
@@ -8,10 +8,129 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
                             QCalendarWidget)
 from PyQt6.QtCore import Qt, QDate
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 import config
 
 
+@lru_cache(maxsize=1)
+def _build_style_sheet() -> str:
+    """QSS 문자열 생성 (config 값이 고정이므로 프로세스당 1회만 생성)
+
+    날짜를 고를 때마다 다이얼로그를 새로 만들므로 스타일 문자열은 재사용합니다.
+
+    Returns:
+        str: 다이얼로그 스타일 시트
+    """
+    return f"""
+            QDialog {{
+                background: {config.COLORS['secondary_bg']};
+                border-radius: {config.UI_METRICS['border_radius']['xl']}px;
+            }}
+
+            /* Calendar Widget */
+            QCalendarWidget QWidget {{
+                background-color: {config.COLORS['card']};
+                color: {config.COLORS['text_primary']};
+            }}
+
+            QCalendarWidget QAbstractItemView:enabled {{
+                background-color: {config.COLORS['secondary_bg']};
+                selection-background-color: {config.COLORS['accent']};
+                selection-color: white;
+                border-radius: {config.UI_METRICS['border_radius']['sm']}px;
+            }}
+
+            QCalendarWidget QWidget#qt_calendar_navigationbar {{
+                background-color: {config.COLORS['card']};
+            }}
+
+            QCalendarWidget QToolButton {{
+                color: {config.COLORS['text_primary']};
+                background-color: transparent;
+                border-radius: {config.UI_METRICS['border_radius']['sm']}px;
+                padding: {config.UI_METRICS['padding']['sm'][0]}px;
+            }}
+
+            QCalendarWidget QToolButton:hover {{
+                background-color: {config.COLORS['card_hover']};
+            }}
+
+            QCalendarWidget QMenu {{
+                background-color: {config.COLORS['secondary_bg']};
+                color: {config.COLORS['text_primary']};
+                border: {config.UI_METRICS['border_width']['thin']}px solid {config.COLORS['border']};
+            }}
+
+            QCalendarWidget QSpinBox {{
+                background-color: {config.COLORS['card']};
+                color: {config.COLORS['text_primary']};
+                selection-background-color: {config.COLORS['accent']};
+                border: {config.UI_METRICS['border_width']['thin']}px solid {config.COLORS['border']};
+                border-radius: {config.UI_METRICS['border_radius']['sm']}px;
+                padding: {config.UI_METRICS['padding']['sm'][0]}px;
+            }}
+
+            /* 버튼 스타일 (EditDialog와 동일) */
+            QPushButton#okBtn {{
+                background: {config.COLORS['accent']};
+                color: white;
+                border: none;
+                border-radius: {config.UI_METRICS['border_radius']['lg']}px;
+                padding: {config.UI_METRICS['padding']['lg'][0]}px {config.UI_METRICS['padding']['lg'][1]}px;
+                font-weight: 500;
+                font-size: {config.FONT_SIZES['base']}px;
+                min-width: 60px;
+            }}
+
+            QPushButton#okBtn:hover {{
+                background: {config.COLORS['accent_hover']};
+            }}
+
+            QPushButton#okBtn:pressed {{
+                background: #B56B4A;
+            }}
+
+            QPushButton#cancelBtn {{
+                background: transparent;
+                border: {config.UI_METRICS['border_width']['thin']}px solid {config.COLORS['border']};
+                border-radius: {config.UI_METRICS['border_radius']['lg']}px;
+                padding: {config.UI_METRICS['padding']['lg'][0]}px {config.UI_METRICS['padding']['lg'][1]}px;
+                color: {config.COLORS['text_secondary']};
+                font-size: {config.FONT_SIZES['base']}px;
+                min-width: 60px;
+            }}
+
+            QPushButton#cancelBtn:hover {{
+                border-color: {config.COLORS['accent']};
+                color: {config.COLORS['text_primary']};
+            }}
+
+            QPushButton#cancelBtn:pressed {{
+                background: rgba(64, 64, 64, 0.1);
+            }}
+
+            QPushButton#clearBtn {{
+                background: transparent;
+                border: {config.UI_METRICS['border_width']['thin']}px solid {config.COLORS['border']};
+                border-radius: {config.UI_METRICS['border_radius']['lg']}px;
+                padding: {config.UI_METRICS['padding']['lg'][0]}px {config.UI_METRICS['padding']['lg'][1]}px;
+                color: {config.COLORS['text_secondary']};
+                font-size: {config.FONT_SIZES['base']}px;
+                min-width: 80px;
+            }}
+
+            QPushButton#clearBtn:hover {{
+                border-color: {config.COLORS['accent']};
+                color: {config.COLORS['text_primary']};
+            }}
+
+            QPushButton#clearBtn:pressed {{
+                background: rgba(64, 64, 64, 0.1);
+            }}
+        """
+
+
 class DatePickerDialog(QDialog):
     """재사용 가능한 날짜 선택 다이얼로그
 
@@ -138,110 +257,4 @@ class DatePickerDialog(QDialog):
 
     def _apply_styles(self):
         """스타일 시트 적용 (EditDialog와 동일한 스타일)"""
-        self.setStyleSheet(f"""
-            QDialog {{
-                background: {config.COLORS['secondary_bg']};
-                border-radius: {config.UI_METRICS['border_radius']['xl']}px;
-            }}
-
-            /* Calendar Widget */
-            QCalendarWidget QWidget {{
-                background-color: {config.COLORS['card']};
-                color: {config.COLORS['text_primary']};
-            }}
-
-            QCalendarWidget QAbstractItemView:enabled {{
-                background-color: {config.COLORS['secondary_bg']};
-                selection-background-color: {config.COLORS['accent']};
-                selection-color: white;
-                border-radius: {config.UI_METRICS['border_radius']['sm']}px;
-            }}
-
-            QCalendarWidget QWidget#qt_calendar_navigationbar {{
-                background-color: {config.COLORS['card']};
-            }}
-
-            QCalendarWidget QToolButton {{
-                color: {config.COLORS['text_primary']};
-                background-color: transparent;
-                border-radius: {config.UI_METRICS['border_radius']['sm']}px;
-                padding: {config.UI_METRICS['padding']['sm'][0]}px;
-            }}
-
-            QCalendarWidget QToolButton:hover {{
-                background-color: {config.COLORS['card_hover']};
-            }}
-
-            QCalendarWidget QMenu {{
-                background-color: {config.COLORS['secondary_bg']};
-                color: {config.COLORS['text_primary']};
-                border: {config.UI_METRICS['border_width']['thin']}px solid {config.COLORS['border']};
-            }}
-
-            QCalendarWidget QSpinBox {{
-                background-color: {config.COLORS['card']};
-                color: {config.COLORS['text_primary']};
-                selection-background-color: {config.COLORS['accent']};
-                border: {config.UI_METRICS['border_width']['thin']}px solid {config.COLORS['border']};
-                border-radius: {config.UI_METRICS['border_radius']['sm']}px;
-                padding: {config.UI_METRICS['padding']['sm'][0]}px;
-            }}
-
-            /* 버튼 스타일 (EditDialog와 동일) */
-            QPushButton#okBtn {{
-                background: {config.COLORS['accent']};
-                color: white;
-                border: none;
-                border-radius: {config.UI_METRICS['border_radius']['lg']}px;
-                padding: {config.UI_METRICS['padding']['lg'][0]}px {config.UI_METRICS['padding']['lg'][1]}px;
-                font-weight: 500;
-                font-size: {config.FONT_SIZES['base']}px;
-                min-width: 60px;
-            }}
-
-            QPushButton#okBtn:hover {{
-                background: {config.COLORS['accent_hover']};
-            }}
-
-            QPushButton#okBtn:pressed {{
-                background: #B56B4A;
-            }}
-
-            QPushButton#cancelBtn {{
-                background: transparent;
-                border: {config.UI_METRICS['border_width']['thin']}px solid {config.COLORS['border']};
-                border-radius: {config.UI_METRICS['border_radius']['lg']}px;
-                padding: {config.UI_METRICS['padding']['lg'][0]}px {config.UI_METRICS['padding']['lg'][1]}px;
-                color: {config.COLORS['text_secondary']};
-                font-size: {config.FONT_SIZES['base']}px;
-                min-width: 60px;
-            }}
-
-            QPushButton#cancelBtn:hover {{
-                border-color: {config.COLORS['accent']};
-                color: {config.COLORS['text_primary']};
-            }}
-
-            QPushButton#cancelBtn:pressed {{
-                background: rgba(64, 64, 64, 0.1);
-            }}
-
-            QPushButton#clearBtn {{
-                background: transparent;
-                border: {config.UI_METRICS['border_width']['thin']}px solid {config.COLORS['border']};
-                border-radius: {config.UI_METRICS['border_radius']['lg']}px;
-                padding: {config.UI_METRICS['padding']['lg'][0]}px {config.UI_METRICS['padding']['lg'][1]}px;
-                color: {config.COLORS['text_secondary']};
-                font-size: {config.FONT_SIZES['base']}px;
-                min-width: 80px;
-            }}
-
-            QPushButton#clearBtn:hover {{
-                border-color: {config.COLORS['accent']};
-                color: {config.COLORS['text_primary']};
-            }}
-
-            QPushButton#clearBtn:pressed {{
-                background: rgba(64, 64, 64, 0.1);
-            }}
-        """)
+        self.setStyleSheet(_build_style_sheet())
@@ -90,7 +90,8 @@ class EditSelectionDialog(QDialog):
         return self.selection
 
     def showEvent(self, event):
-        """다이얼로그 표시 시 QPalette 적용"""
+        """다이얼로그 표시 시 QPalette 적용 (재사용 시 이전 선택 초기화)"""
+        self.selection = None
         super().showEvent(event)
         if not self._palette_applied:
             palette = create_dialog_palette()
@@ -512,7 +513,7 @@ class EditDialog(QDialog):
                         self.recurrence_end_date,
                         datetime.min.time()
                     )
-            except:
+            except (TypeError, ValueError):
                 pass
 
         # DatePickerDialog 사용
@@ -1209,7 +1210,7 @@ class SubTaskEditDialog(QDialog):
         if self.selected_date:
             try:
                 initial_date = datetime.fromisoformat(self.selected_date)
-            except:
+            except (TypeError, ValueError):
                 pass
 
         # DatePickerDialog 사용
@@ -1239,14 +1240,15 @@ class SubTaskEditDialog(QDialog):
         self.accept()
 
     def set_data(self, content: str, due_date: Optional[str] = None):
-        """데이터 설정"""
+        """데이터 설정 (다이얼로그 재사용 시 이전 입력 덮어씀)"""
         self.content_edit.setPlainText(content)
+        self.content_edit.setFocus()
         if due_date:
             self.selected_date = due_date
             try:
                 dt = datetime.fromisoformat(due_date)
                 self.selected_date_label.setText(dt.strftime("%Y년 %m월 %d일"))
-            except:
+            except (TypeError, ValueError):
                 self.selected_date_label.setText(due_date)
         else:
             self.selected_date = None
@@ -226,12 +226,12 @@ class SubTaskListDialog(QDialog):
 
         # 납기일 표시 (있는 경우) - 메인 할일과 동일한 배지 스타일
         if subtask.due_date:
-            due_label = QLabel(subtask.due_date.format_display_text())
+            due_text, status = subtask.due_date.display_info()
+            due_label = QLabel(due_text)
             due_label.setObjectName("subtaskDueLabel")
             due_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-            # 상태 계산 및 색상 적용
-            status = subtask.due_date.calculate_status()
+            # 상태별 색상 적용
             bg_color = config.DUE_DATE_COLORS.get(status, config.DUE_DATE_COLORS['normal'])['bg']
             text_color = config.DUE_DATE_COLORS.get(status, config.DUE_DATE_COLORS['normal'])['color']
 
@@ -5,12 +5,15 @@
 포트 기반 소켓 락을 사용하여 애플리케이션의 중복 실행을 방지하고,
 중복 실행 시도 시 기존 창을 활성화합니다.
 """
+import logging
 import socket
 import sys
 import threading
 from typing import Optional
 from PyQt6.QtCore import QObject, pyqtSignal
 
+logger = logging.getLogger(__name__)
+
 
 class SingleInstanceManager(QObject):
     """
@@ -147,7 +150,7 @@ class SingleInstanceManager(QObject):
             except Exception as e:
                 # 리스닝 중이면 에러 로깅, 아니면 종료
                 if self._is_listening:
-                    print(f"SingleInstanceManager 리스너 에러: {e}")
+                    logger.error("SingleInstanceManager 리스너 에러: %s", e)
                 break
 
     def activate_existing_instance(self) -> bool:
@@ -183,7 +186,7 @@ class SingleInstanceManager(QObject):
 
         except (socket.timeout, ConnectionRefusedError, OSError) as e:
             # 연결 실패 (기존 인스턴스가 응답하지 않음)
-            print(f"기존 인스턴스 활성화 실패: {e}")
+            logger.warning("기존 인스턴스 활성화 실패: %s", e)
             return False
 
     def cleanup(self):
@@ -204,7 +207,7 @@ class SingleInstanceManager(QObject):
             try:
                 self._server_socket.close()
             except Exception as e:
-                print(f"서버 소켓 닫기 실패: {e}")
+                logger.warning("서버 소켓 닫기 실패: %s", e)
             finally:
                 self._server_socket = None
 
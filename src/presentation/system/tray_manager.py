@@ -8,16 +8,38 @@ Simple ToDo 애플리케이션의 시스템 트레이 통합을 담당합니다.
 - 좌클릭: 창 표시/숨김 토글
 - 우클릭: 컨텍스트 메뉴 표시
 """
+import logging
+import threading
 import webbrowser
 from typing import TYPE_CHECKING
 
 from PyQt6.QtWidgets import QSystemTrayIcon, QMenu
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QAction
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 
 if TYPE_CHECKING:
     from src.presentation.ui.main_window import MainWindow
 
+logger = logging.getLogger(__name__)
+
+KOCHIM_URL = "https://kochim.com"
+
+
+def _open_browser(url: str) -> None:
+    """
+    기본 브라우저로 URL 열기 (백그라운드 스레드에서 실행)
+
+    webbrowser.open은 브라우저가 초기화될 때까지 수 초간 블로킹될 수 있으므로
+    UI 스레드가 아닌 곳에서 호출합니다.
+
+    Args:
+        url: 열 URL
+    """
+    try:
+        webbrowser.open(url)
+    except Exception as e:
+        logger.warning("브라우저 열기 실패 (%s): %s", url, e)
+
 
 class SystemTrayManager:
     """
@@ -36,7 +58,10 @@ class SystemTrayManager:
         """
         self.main_window = main_window
         self.tray_icon = QSystemTrayIcon()
-        self.setup_tray()
+
+        # 아이콘 로드/메뉴 구성은 이벤트 루프 진입 후로 미룸
+        # (메인 윈도우 첫 표시를 먼저 처리)
+        QTimer.singleShot(0, self.setup_tray)
 
     def setup_tray(self) -> None:
         """트레이 아이콘 및 메뉴 설정"""
@@ -162,8 +187,8 @@ class SystemTrayManager:
         self.main_window.check_for_updates_manual()
 
     def _open_kochim_website(self) -> None:
-        """kochim.com 웹사이트 브라우저에서 열기"""
-        webbrowser.open("https://kochim.com")
+        """kochim.com 웹사이트 브라우저에서 열기 (UI 블로킹 방지를 위해 백그라운드 실행)"""
+        threading.Thread(target=_open_browser, args=(KOCHIM_URL,), daemon=True).start()
 
     def _create_checkmark_icon(self, size: int = 32) -> QIcon:
         """
@@ -4,7 +4,6 @@
 import logging
 from pathlib import Path
 from PyQt6.QtWidgets import QMainWindow, QMessageBox
-from PyQt6.QtCore import QTimer
 from PyQt6.QtGui import QCloseEvent
 from typing import TYPE_CHECKING, Optional
 
@@ -81,6 +80,8 @@ class UpdateManager:
 
         # Worker 및 Dialog 참조
         self.check_worker: Optional[UpdateCheckWorker] = None
+        # 자동 체크 진행 중에 요청된 수동 체크 (진행 중인 체크가 끝나면 실행)
+        self._pending_force_check = False
         self.download_worker: Optional[UpdateDownloadWorker] = None
         self.progress_dialog: Optional[UpdateProgressDialog] = None
 
@@ -91,21 +92,18 @@ class UpdateManager:
     def check_for_updates_on_startup(self):
         """앱 시작 시 자동 업데이트 체크를 수행합니다.
 
-        앱 시작 3초 후에 백그라운드에서 체크를 수행합니다.
-        UpdateSchedulerService로 체크 여부를 확인한 후 실행합니다.
+        UpdateSchedulerService로 체크 여부를 확인한 후 바로 백그라운드 체크를 시작합니다.
 
         Note:
-            QTimer를 사용하여 앱 시작 후 3초 뒤에 체크를 수행합니다.
-            이는 앱 초기화가 완료된 후 체크하기 위함입니다.
+            시작 지연(3초)은 호출 측(MainWindow)의 QTimer 하나로만 처리합니다.
+            여기서 다시 지연하면 체크가 6초 뒤로 밀리므로 즉시 시작합니다.
         """
         # 자동 체크가 활성화되어 있는지 확인
         if not self.scheduler.should_check_on_startup():
             logger.info("자동 업데이트 체크 건너뛰기")
             return
 
-        # 3초 후 체크 시작
-        logger.info("앱 시작 3초 후 자동 업데이트 체크 예약")
-        QTimer.singleShot(3000, self._start_auto_check)
+        self._start_auto_check()
 
     def check_for_updates_manual(self):
         """수동으로 업데이트를 확인합니다.
@@ -121,30 +119,54 @@ class UpdateManager:
         # 건너뛴 버전 초기화 (수동 체크 시 모든 버전 알림)
         self.scheduler.reset_skipped_version()
 
-        # Worker 생성 및 시작 (is_force_check=True로 interval 무시)
-        self.check_worker = UpdateCheckWorker(self.check_use_case, is_force_check=True)
-        self.check_worker.update_available.connect(self._on_update_available)
-        self.check_worker.no_update.connect(self._on_no_update_manual)
-        self.check_worker.check_failed.connect(self._on_check_failed)
-        self.check_worker.start()
-
-        logger.info("수동 업데이트 체크 Worker 시작 (강제 체크 모드)")
+        # 공용 Worker 재사용 (is_force_check=True로 interval 무시)
+        self._run_check_worker(is_force_check=True)
 
     def _start_auto_check(self):
         """자동 업데이트 체크를 시작합니다 (내부 메서드).
 
-        앱 시작 3초 후에 호출되며, 백그라운드에서 체크를 수행합니다.
+        check_for_updates_on_startup()에서 호출되며, 백그라운드에서 체크를 수행합니다.
         """
         logger.info("자동 업데이트 체크 시작")
 
-        # Worker 생성 및 시작
-        self.check_worker = UpdateCheckWorker(self.check_use_case)
-        self.check_worker.update_available.connect(self._on_update_available)
-        self.check_worker.no_update.connect(self._on_no_update_auto)
-        self.check_worker.check_failed.connect(self._on_check_failed)
+        # 공용 Worker 재사용
+        self._run_check_worker(is_force_check=False)
+
+    def _run_check_worker(self, is_force_check: bool):
+        """공용 UpdateCheckWorker로 체크를 실행합니다 (내부 메서드).
+
+        Worker(QThread)는 최초 1회만 생성하고 시그널도 그때 한 번만 연결합니다.
+        이후에는 모드만 바꿔 같은 스레드 객체를 다시 start()합니다.
+        이미 체크가 진행 중이면 중복 실행하지 않습니다.
+        단, 자동 체크 중 수동 체크가 요청되면 끝난 뒤 수동 체크를 이어서 실행합니다.
+
+        Args:
+            is_force_check: 강제 체크 여부 (True = interval 무시, 수동 체크)
+        """
+        if self.check_worker is None:
+            self.check_worker = UpdateCheckWorker(self.check_use_case)
+            self.check_worker.update_available.connect(self._on_update_available)
+            self.check_worker.no_update.connect(self._on_no_update)
+            self.check_worker.check_failed.connect(self._on_check_failed)
+            self.check_worker.finished.connect(self._on_check_worker_finished)
+        elif self.check_worker.isRunning():
+            if is_force_check and not self.check_worker.is_force_check:
+                logger.info("자동 업데이트 체크 진행 중 - 완료 후 수동 체크 실행")
+                self._pending_force_check = True
+            else:
+                logger.info("업데이트 체크가 이미 진행 중입니다")
+            return
+
+        self.check_worker.is_force_check = is_force_check
         self.check_worker.start()
 
-        logger.info("자동 업데이트 체크 Worker 시작")
+        logger.info(f"업데이트 체크 Worker 시작 (force_check={is_force_check})")
+
+    def _on_check_worker_finished(self):
+        """체크 Worker 종료 시 대기 중인 수동 체크를 실행합니다."""
+        if self._pending_force_check:
+            self._pending_force_check = False
+            self._run_check_worker(is_force_check=True)
 
     def _on_update_available(self, release: 'Release'):
         """업데이트가 발견되었을 때 호출됩니다.
@@ -156,14 +178,22 @@ class UpdateManager:
         """
         logger.info(f"업데이트 발견: v{release.version}")
 
-        # Worker 정리
-        if self.check_worker:
-            self.check_worker.deleteLater()
-            self.check_worker = None
+        # 이미 결과를 표시하므로 대기 중인 수동 체크는 불필요
+        self._pending_force_check = False
 
         # 업데이트 다이얼로그 표시
         self._show_update_dialog(release)
 
+    def _on_no_update(self):
+        """업데이트가 없을 때 호출됩니다.
+
+        Worker의 체크 모드에 따라 자동/수동 처리로 분기합니다.
+        """
+        if self.check_worker and self.check_worker.is_force_check:
+            self._on_no_update_manual()
+        else:
+            self._on_no_update_auto()
+
     def _on_no_update_auto(self):
         """업데이트가 없을 때 호출됩니다 (자동 체크).
 
@@ -171,11 +201,6 @@ class UpdateManager:
         """
         logger.info("업데이트 없음 (자동 체크)")
 
-        # Worker 정리
-        if self.check_worker:
-            self.check_worker.deleteLater()
-            self.check_worker = None
-
     def _on_no_update_manual(self):
         """업데이트가 없을 때 호출됩니다 (수동 체크).
 
@@ -183,11 +208,6 @@ class UpdateManager:
         """
         logger.info("업데이트 없음 (수동 체크)")
 
-        # Worker 정리
-        if self.check_worker:
-            self.check_worker.deleteLater()
-            self.check_worker = None
-
         # 메시지 박스 표시
         QMessageBox.information(
             self.parent_window,
@@ -203,11 +223,6 @@ class UpdateManager:
         """
         logger.error(f"업데이트 체크 실패: {error_message}")
 
-        # Worker 정리
-        if self.check_worker:
-            self.check_worker.deleteLater()
-            self.check_worker = None
-
         # 에러 메시지 표시 (선택적)
         # 자동 체크에서는 에러 메시지를 표시하지 않음 (사용자 방해 최소화)
         # 수동 체크에서만 표시하려면 플래그 추가 필요
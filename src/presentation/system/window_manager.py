@@ -54,9 +54,8 @@ class WindowManager:
         restored = self._restore_window_state()
 
         if not restored:
-            # 저장된 상태가 없으면 기본값 사용
-            self.main_window.resize(default_width, default_height)
-            self._center_on_screen()
+            # 저장된 상태가 없으면 기본 크기로 화면 중앙에 배치 (geometry 1회 설정)
+            self._center_on_screen(default_width, default_height)
 
         logger.info(f"Window setup completed: size={self.main_window.size()}, pos={self.main_window.pos()}")
 
@@ -66,26 +65,26 @@ class WindowManager:
         Qt WindowFlags를 조작하여 항상 위 상태를 변경합니다.
         변경 후 설정을 저장합니다.
         """
-        current_flags = self.main_window.windowFlags()
-
-        if self.is_always_on_top:
-            # 항상 위 비활성화
-            new_flags = current_flags & ~Qt.WindowType.WindowStaysOnTopHint
-            self.is_always_on_top = False
-            logger.info("Always on top: disabled")
-        else:
-            # 항상 위 활성화
-            new_flags = current_flags | Qt.WindowType.WindowStaysOnTopHint
-            self.is_always_on_top = True
-            logger.info("Always on top: enabled")
-
-        # 윈도우 플래그 적용
-        self.main_window.setWindowFlags(new_flags)
-        self.main_window.show()  # 플래그 변경 후 재표시 필요
+        self._apply_always_on_top(not self.is_always_on_top)
 
         # 상태 저장
         self.save_window_state()
 
+    def _apply_always_on_top(self, enabled: bool) -> None:
+        """항상 위 플래그 적용 (저장 없음)
+
+        Args:
+            enabled: 항상 위 활성화 여부
+        """
+        self.is_always_on_top = enabled
+        logger.info("Always on top: %s", "enabled" if enabled else "disabled")
+
+        # 플래그 변경 시 네이티브 창이 숨겨지므로, 이미 표시 중인 경우에만 재표시
+        was_visible = self.main_window.isVisible()
+        self.main_window.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, enabled)
+        if was_visible:
+            self.main_window.show()
+
     def save_window_state(self) -> None:
         """현재 윈도우 상태를 저장합니다
 
@@ -146,8 +145,8 @@ class WindowManager:
             # alwaysOnTop 복원
             always_on_top = settings.get("alwaysOnTop", False)
             if always_on_top:
-                self.is_always_on_top = False  # toggle_always_on_top이 반전시키므로 반대값 설정
-                self.toggle_always_on_top()
+                # 복원 시에는 플래그만 적용 (방금 읽은 설정을 다시 저장하지 않음, 창 표시는 호출 측에서)
+                self._apply_always_on_top(True)
 
             return True
 
@@ -155,44 +154,42 @@ class WindowManager:
             logger.error(f"Failed to restore window state: {e}")
             return False
 
-    def _center_on_screen(self) -> None:
-        """윈도우를 화면 중앙에 배치합니다"""
+    def _center_on_screen(self, width: int, height: int) -> None:
+        """윈도우를 주어진 크기로 화면 중앙에 배치합니다
+
+        크기와 위치를 미리 계산해 setGeometry()로 한 번에 적용합니다.
+        (resize 후 move로 두 번 geometry를 바꾸지 않음)
+
+        Args:
+            width: 윈도우 너비
+            height: 윈도우 높이
+        """
         # 현재 화면 가져오기
         screen = self._get_current_screen()
         if not screen:
             logger.warning("Failed to get screen geometry")
+            self.main_window.resize(width, height)
             return
 
-        screen_geometry = screen.availableGeometry()
-        window_geometry = self.main_window.frameGeometry()
+        screen_center = screen.availableGeometry().center()
 
         # 중앙 위치 계산
-        center_x = screen_geometry.center().x() - window_geometry.width() // 2
-        center_y = screen_geometry.center().y() - window_geometry.height() // 2
+        center_x = screen_center.x() - width // 2
+        center_y = screen_center.y() - height // 2
 
-        self.main_window.move(center_x, center_y)
+        self.main_window.setGeometry(center_x, center_y, width, height)
         logger.info(f"Window centered at: x={center_x}, y={center_y}")
 
     def _get_current_screen(self) -> Optional[QScreen]:
-        """현재 마우스 커서가 있는 스크린을 반환합니다
+        """윈도우를 배치할 스크린을 반환합니다
+
+        기본(primary) 스크린을 바로 반환합니다.
+        (기본 스크린 중앙 좌표로 screenAt()을 다시 조회해도 결과는 같으므로 생략)
 
         Returns:
-            Optional[QScreen]: 현재 스크린 (실패 시 기본 스크린)
+            Optional[QScreen]: 기본 스크린 (없으면 None)
         """
-        try:
-            # QApplication에서 현재 스크린 가져오기
-            cursor_pos = QApplication.primaryScreen().availableGeometry().center()
-            screen = QApplication.screenAt(cursor_pos)
-
-            if screen:
-                return screen
-            else:
-                # 기본 스크린 반환
-                return QApplication.primaryScreen()
-
-        except Exception as e:
-            logger.error(f"Failed to get current screen: {e}")
-            return QApplication.primaryScreen()
+        return QApplication.primaryScreen()
 
     def _is_geometry_valid(self, x: int, y: int, width: int, height: int) -> bool:
         """주어진 geometry가 화면 범위 내에 있는지 검증합니다
@@ -207,20 +204,17 @@ class WindowManager:
             bool: 유효하면 True, 아니면 False
         """
         try:
-            # 모든 스크린 확인
+            # 모든 스크린 확인 (루프와 무관한 값은 미리 계산)
             screens = QApplication.screens()
             window_rect = QRect(x, y, width, height)
+            min_visible_area = width * height * 0.5
 
             for screen in screens:
-                screen_rect = screen.availableGeometry()
-                # 윈도우가 스크린과 교차하는지 확인 (최소 50% 이상 보여야 함)
-                if screen_rect.intersects(window_rect):
-                    intersection = screen_rect.intersected(window_rect)
-                    # 교차 영역이 윈도우의 50% 이상인지 확인
-                    window_area = width * height
-                    intersection_area = intersection.width() * intersection.height()
-                    if intersection_area >= window_area * 0.5:
-                        return True
+                # 윈도우와 스크린의 교차 영역 (교차하지 않으면 빈 사각형)
+                intersection = screen.availableGeometry().intersected(window_rect)
+                # 교차 영역이 윈도우의 50% 이상인지 확인
+                if not intersection.isEmpty() and intersection.width() * intersection.height() >= min_visible_area:
+                    return True
 
             logger.warning(f"Geometry is outside screen bounds: x={x}, y={y}, w={width}, h={height}")
             return False
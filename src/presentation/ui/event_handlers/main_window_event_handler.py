@@ -71,6 +71,11 @@ class MainWindowEventHandler:
 
         # EditDialog 인스턴스 (재사용)
         self.edit_dialog = None
+        # 편집 대상 선택/하위 할일 편집 다이얼로그 (첫 사용 시 생성 후 재사용)
+        self.selection_dialog = None
+        self.subtask_edit_dialog = None
+        # TODO 관리(백업) 다이얼로그 (첫 사용 시 생성, 재사용 시 데이터만 다시 로드)
+        self.backup_manager_dialog = None
 
         # Splitter throttle (100ms)
         self._pending_split_ratio: Optional[tuple[float, float]] = None
@@ -168,7 +173,10 @@ class MainWindowEventHandler:
             # Throttle: is_active()면 무시
             if not self._split_throttler.is_active():
                 self._split_throttler.schedule()
-                logger.debug(f"Splitter save queued (throttle 100ms): sizes={sizes}, ratios=[{in_progress_ratio:.2f}, {completed_ratio:.2f}]")
+                logger.debug(
+                    "Splitter save queued (throttle 100ms): sizes=%s, ratios=[%.2f, %.2f]",
+                    sizes, in_progress_ratio, completed_ratio
+                )
 
     def _execute_split_ratio_save(self, data=None) -> None:
         """Throttle 완료 시 실제 저장"""
@@ -227,16 +235,9 @@ class MainWindowEventHandler:
             in_progress_todos: 진행중 TODO 리스트
             completed_todos: 완료 TODO 리스트
         """
-        # 섹션 초기화
-        self.in_progress_section.clear_all()
-        self.completed_section.clear_all()
-
-        # 정렬된 TODO 추가
-        for todo in in_progress_todos:
-            self.in_progress_section.add_todo(todo)
-
-        for todo in completed_todos:
-            self.completed_section.add_todo(todo)
+        # 섹션 동기화 (변경된 TODO만 위젯 재생성, 나머지는 순서만 조정)
+        self.in_progress_section.sync_todos(in_progress_todos)
+        self.completed_section.sync_todos(completed_todos)
 
         # Footer 카운트 업데이트
         in_progress_count = len(self.in_progress_section.todo_items)
@@ -268,7 +269,7 @@ class MainWindowEventHandler:
         # UI 갱신 (DRY - _refresh_ui 재사용)
         self._refresh_ui(in_progress, completed)
 
-        logger.debug(f"UI refreshed without sorting: {len(in_progress) + len(completed)} todos")
+        logger.debug("UI refreshed without sorting: %d todos", len(in_progress) + len(completed))
 
     def on_sort_changed(self, index: int) -> None:
         """정렬 순서 변경 핸들러
@@ -332,7 +333,7 @@ class MainWindowEventHandler:
             # UI 갱신
             self._refresh_ui(in_progress, completed)
 
-            logger.debug(f"Search: '{query}' → {len(filtered_todos)} results")
+            logger.debug("Search: '%s' → %d results", query, len(filtered_todos))
 
         except Exception as e:
             logger.error(f"Failed to search todos: {e}", exc_info=True)
@@ -399,12 +400,8 @@ class MainWindowEventHandler:
             todo_id: 편집할 TODO ID
         """
         try:
-            # 1. TodoService에서 해당 TODO 조회
-            todo = None
-            for t in self.todo_service.get_all_todos():
-                if str(t.id) == todo_id:
-                    todo = t
-                    break
+            # 1. TodoService에서 해당 TODO 조회 (ID로 직접 조회, 전체 목록 변환 없음)
+            todo = self.todo_service.get_todo(TodoId.from_string(todo_id))
 
             if not todo:
                 logger.error(f"TODO not found for edit: {todo_id}")
@@ -442,15 +439,16 @@ class MainWindowEventHandler:
             todo: Todo 객체
         """
         try:
-            # 1. EditSelectionDialog 표시
-            selection_dialog = EditSelectionDialog(self.main_window)
-            result = selection_dialog.exec()
+            # 1. EditSelectionDialog 표시 (없으면 생성, 있으면 재사용)
+            if not self.selection_dialog:
+                self.selection_dialog = EditSelectionDialog(self.main_window)
+            result = self.selection_dialog.exec()
 
             if result != QDialog.DialogCode.Accepted:
                 # 취소됨
                 return
 
-            selection = selection_dialog.get_selection()
+            selection = self.selection_dialog.get_selection()
 
             if selection == "main":
                 # 메인 할일 편집 - 기존 on_todo_edit 호출
@@ -701,13 +699,18 @@ class MainWindowEventHandler:
         (백업 복구 또는 삭제 작업 후)
         """
         try:
-            dialog = BackupManagerDialog(
-                parent=self.main_window,
-                repository=self.repository,
-                todo_service=self.todo_service
-            )
+            if not self.backup_manager_dialog:
+                self.backup_manager_dialog = BackupManagerDialog(
+                    parent=self.main_window,
+                    repository=self.repository,
+                    todo_service=self.todo_service
+                )
+            else:
+                # 재사용: 이전 검색어/미리보기를 지우고 백업/TODO 목록을 최신 상태로 갱신
+                self.backup_manager_dialog.reset_state()
+                self.backup_manager_dialog.load_data()
 
-            result = dialog.exec()
+            result = self.backup_manager_dialog.exec()
 
             if result == QDialog.DialogCode.Accepted:
                 # 변경사항이 있으면 UI 갱신
@@ -759,8 +762,10 @@ class MainWindowEventHandler:
                 logger.error(f"Subtask not found: {subtask_id.value}")
                 return
 
-            # 3. SubTaskEditDialog 열기
-            dialog = SubTaskEditDialog(self.main_window)
+            # 3. SubTaskEditDialog 열기 (없으면 생성, 있으면 재사용)
+            if not self.subtask_edit_dialog:
+                self.subtask_edit_dialog = SubTaskEditDialog(self.main_window)
+            dialog = self.subtask_edit_dialog
             due_date_str = subtask.due_date.value.isoformat() if subtask.due_date else None
             dialog.set_data(str(subtask.content), due_date_str)
 
@@ -929,4 +934,4 @@ class MainWindowEventHandler:
             for todo_id, widget in section.todo_widgets.items():
                 if todo_id in self._expanded_todos:
                     widget.set_expanded(True)
-                    logger.debug(f"TODO 펼침 상태 복원: id={todo_id}")
+                    logger.debug("TODO 펼침 상태 복원: id=%s", todo_id)
@@ -17,6 +17,9 @@ from src.presentation.system.window_manager import WindowManager
 
 logger = logging.getLogger(__name__)
 
+# 분할 비율 → Splitter 가중치 변환 배율
+SPLIT_RATIO_SCALE = 10000
+
 
 class MainWindow(QMainWindow):
     """
@@ -75,10 +78,9 @@ class MainWindow(QMainWindow):
         from src.presentation.system.tray_manager import SystemTrayManager
         self.tray_manager = SystemTrayManager(self)
 
-        # 저장된 분할 비율 복원 (레이아웃 완료 후 적용)
+        # 저장된 분할 비율 복원 (표시 전에 적용하여 첫 레이아웃부터 반영)
         if self.repository:
-            # QTimer로 레이아웃이 완료된 후 비율 복원
-            QTimer.singleShot(100, self._restore_split_ratio)
+            self._restore_split_ratio()
 
         # 초기 TODO 로드 (EventHandler에 위임)
         self.event_handler.load_todos()
@@ -161,7 +163,12 @@ class MainWindow(QMainWindow):
 
 
     def _restore_split_ratio(self) -> None:
-        """저장된 분할 비율을 복원합니다"""
+        """저장된 분할 비율을 복원합니다
+
+        QSplitter는 setSizes() 값을 가중치로 보고 실제 높이에 비례 배분하므로,
+        레이아웃 완료를 기다리지 않고 창 표시 전에 바로 적용합니다.
+        (표시 후 타이머로 적용할 때 생기던 분할바 점프 제거)
+        """
         if not self.repository:
             return
 
@@ -169,21 +176,16 @@ class MainWindow(QMainWindow):
             settings = self.repository.get_settings()
             split_ratio = settings.get("splitRatio", [9, 1])  # 기본값: 진행중 90%, 완료 10%
 
-            if len(split_ratio) == 2:
-                # Splitter의 전체 높이 가져오기
-                total_height = self.splitter.height()
-
-                if total_height > 0:
-                    # 비율을 픽셀 크기로 변환
-                    in_progress_height = int(total_height * split_ratio[0] / sum(split_ratio))
-                    completed_height = int(total_height * split_ratio[1] / sum(split_ratio))
-
-                    # Splitter에 적용
-                    self.splitter.setSizes([in_progress_height, completed_height])
+            if len(split_ratio) == 2 and sum(split_ratio) > 0:
+                # 비율을 정수 가중치로 변환 (Splitter가 실제 높이에 맞춰 비례 배분)
+                total = sum(split_ratio)
+                weights = [
+                    int(SPLIT_RATIO_SCALE * split_ratio[0] / total),
+                    int(SPLIT_RATIO_SCALE * split_ratio[1] / total)
+                ]
+                self.splitter.setSizes(weights)
 
-                    logger.info(f"Split ratio restored: {split_ratio}, heights=[{in_progress_height}, {completed_height}]")
-                else:
-                    logger.warning(f"Splitter height is 0, cannot restore split ratio yet")
+                logger.info(f"Split ratio restored: {split_ratio}, weights={weights}")
         except Exception as e:
             logger.error(f"Failed to restore split ratio: {e}")
 
@@ -220,7 +222,7 @@ class MainWindow(QMainWindow):
         if self.update_manager:
             try:
                 self.update_manager.check_for_updates_on_startup()
-                logger.info("Auto-update check scheduled on startup")
+                logger.info("Auto-update check started on startup")
             except Exception as e:
                 logger.error(f"Failed to schedule auto-update check: {e}")
         else:
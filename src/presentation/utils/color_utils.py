@@ -7,6 +7,8 @@ QPalette 생성 및 색상 파싱을 위한 중앙집중식 유틸리티 함수
 
 from PyQt6.QtGui import QPalette, QColor, QBrush
 from PyQt6.QtWidgets import QWidget
+from functools import lru_cache
+import logging
 import config
 
 
@@ -28,8 +30,6 @@ def parse_color(color_str: str) -> QColor:
         >>> parse_color('invalid')  # 실패 시 폴백
         QColor(255, 255, 255)
     """
-    import logging
-
     try:
         if color_str.startswith('rgba'):
             # rgba(255, 255, 255, 0.92) -> QColor
@@ -66,6 +66,20 @@ def create_dialog_palette() -> QPalette:
         >>> palette = create_dialog_palette()
         >>> dialog.setPalette(palette)
         >>> dialog.setAutoFillBackground(True)
+
+    색상 파싱은 최초 1회만 수행하고, 이후에는 캐시된 팔레트의 복사본을 반환합니다.
+    (QPalette는 암시적 공유라 복사 비용이 작고, 호출 측에서 수정해도 캐시에 영향 없음)
+    """
+    return QPalette(_build_dialog_palette())
+
+
+@lru_cache(maxsize=1)
+def _build_dialog_palette() -> QPalette:
+    """
+    다이얼로그용 QPalette 실제 생성 (config.COLORS 기반, 캐시됨)
+
+    Returns:
+        QPalette: 다크 모드 색상이 적용된 팔레트 객체
     """
     palette = QPalette()
 
@@ -5,20 +5,21 @@ TODO 텍스트에서 URL과 파일 경로를 추출합니다.
 """
 
 import re
+from functools import lru_cache
 from typing import List, Tuple
 
 
 class LinkParser:
     """링크 및 파일 경로 파싱 유틸리티."""
 
-    # 정규식 패턴 (명세서 6.1, 6.2)
+    # 정규식 패턴 (명세서 6.1, 6.2) - 클래스 로드 시 1회 컴파일
     # URL: 구두점(쉼표, 세미콜론, 마침표 등)을 제외
-    URL_PATTERN = r'(https?://[^\s,;!?]+)|(www\.[^\s,;!?]+)'
+    URL_PATTERN = re.compile(r'(https?://[^\s,;!?]+)|(www\.[^\s,;!?]+)')
     # 파일 경로: Windows 절대 경로 및 네트워크 경로
     # - 백슬래시로 끝나는 폴더 경로: "C:\Users\", "C:\Program Files\"
     # - 파일로 끝나는 경로: "C:\file.txt", "C:\Program Files\app.exe"
     # - 백슬래시 뒤 공백으로 경로 종료: "C:\Users\ 정리" → "C:\Users\"
-    PATH_PATTERN = r'([A-Za-z]:\\(?:(?:[^\\]+\\)+|(?:[^\\]+\\)*[^\\\s]+))|(\\\\[^\\\s]+\\(?:(?:[^\\]+\\)+|(?:[^\\]+\\)*[^\\\s]+))'
+    PATH_PATTERN = re.compile(r'([A-Za-z]:\\(?:(?:[^\\]+\\)+|(?:[^\\]+\\)*[^\\\s]+))|(\\\\[^\\\s]+\\(?:(?:[^\\]+\\)+|(?:[^\\]+\\)*[^\\\s]+))')
 
     @staticmethod
     def parse_text(text: str) -> List[Tuple[str, str, int, int]]:
@@ -37,20 +38,36 @@ class LinkParser:
                 ('url', 'https://claude.ai', 4, 21),
                 ('path', 'C:\\docs\\file.txt', 29, 47)
             ]
+
+        같은 텍스트의 파싱 결과는 캐시되어 위젯을 다시 생성해도 재사용됩니다.
+        반환되는 리스트는 호출마다 새로 생성되므로 수정해도 캐시에 영향이 없습니다.
+        """
+        return list(LinkParser._parse_text_cached(text))
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_text_cached(text: str) -> Tuple[Tuple[str, str, int, int], ...]:
+        """텍스트에서 링크/경로 추출 (캐시됨).
+
+        Args:
+            text: TODO 텍스트
+
+        Returns:
+            Tuple[Tuple[str, str, int, int], ...]: 위치 순으로 정렬된 링크 튜플
         """
         results = []
 
         # URL 매칭
-        for match in re.finditer(LinkParser.URL_PATTERN, text):
+        for match in LinkParser.URL_PATTERN.finditer(text):
             url = match.group(0)
             results.append(('url', url, match.start(), match.end()))
 
         # 파일 경로 매칭
-        for match in re.finditer(LinkParser.PATH_PATTERN, text):
+        for match in LinkParser.PATH_PATTERN.finditer(text):
             path = match.group(0)
             results.append(('path', path, match.start(), match.end()))
 
         # 위치 순서로 정렬
         results.sort(key=lambda x: x[2])
 
-        return results
+        return tuple(results)
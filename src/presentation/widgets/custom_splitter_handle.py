@@ -4,6 +4,8 @@
 
 HTML 프로토타입처럼 중앙에 점('⋯') + 가로선을 표시하는 QSplitterHandle
 """
+from functools import lru_cache
+
 from PyQt6.QtWidgets import QSplitterHandle
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPainter, QPen, QColor, QFont
@@ -11,6 +13,31 @@ from PyQt6.QtGui import QPainter, QPen, QColor, QFont
 import config
 
 
+@lru_cache(maxsize=2)
+def _paint_resources(hovered: bool) -> tuple:
+    """호버 상태별 그리기 리소스를 한 번만 생성하여 재사용
+
+    paintEvent마다 QColor/QPen/QFont를 새로 만들지 않도록 캐시합니다.
+
+    Args:
+        hovered: 호버 여부
+
+    Returns:
+        tuple: (배경색, 선 색상, 선 펜, 점 폰트)
+    """
+    if hovered:
+        line_color = QColor(config.COLORS['accent'])
+        line_height = config.SPLITTER_CONFIG['line_height_hover']
+    else:
+        line_color = QColor(config.COLORS['border'])
+        line_height = config.SPLITTER_CONFIG['line_height_normal']
+
+    background = QColor(config.COLORS['primary_bg'])
+    pen = QPen(line_color, line_height)
+    font = QFont('Segoe UI', config.SPLITTER_CONFIG['dots_font_size'])
+    return background, line_color, pen, font
+
+
 class CustomSplitterHandle(QSplitterHandle):
     """
     커스텀 Splitter Handle
@@ -45,16 +72,11 @@ class CustomSplitterHandle(QSplitterHandle):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # 배경색 (투명) - 전체 영역
-        painter.fillRect(self.rect(), QColor(config.COLORS['primary_bg']))
+        # 호버 여부에 따른 색상/펜/폰트 (캐시된 리소스)
+        background, line_color, pen, font = _paint_resources(self._is_hovered)
 
-        # 색상 결정 (호버 여부)
-        if self._is_hovered:
-            line_color = QColor(config.COLORS['accent'])
-            line_height = config.SPLITTER_CONFIG['line_height_hover']
-        else:
-            line_color = QColor(config.COLORS['border'])
-            line_height = config.SPLITTER_CONFIG['line_height_normal']
+        # 배경색 (투명) - 전체 영역
+        painter.fillRect(self.rect(), background)
 
         # 실제 그리기 영역 (위아래 여백)
         margin_top = config.SPLITTER_CONFIG['margin']
@@ -62,14 +84,12 @@ class CustomSplitterHandle(QSplitterHandle):
         draw_rect = self.rect().adjusted(0, margin_top, 0, -margin_bottom)
 
         # 가로선 그리기 (중앙)
-        pen = QPen(line_color, line_height)
         painter.setPen(pen)
 
         center_y = draw_rect.center().y()
         painter.drawLine(0, center_y, self.rect().width(), center_y)
 
         # 점 3개 ('⋯') 그리기 (중앙)
-        font = QFont('Segoe UI', config.SPLITTER_CONFIG['dots_font_size'])
         painter.setFont(font)
         painter.setPen(line_color)
         painter.drawText(draw_rect, Qt.AlignmentFlag.AlignCenter, '⋯')
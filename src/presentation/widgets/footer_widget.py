@@ -11,6 +11,18 @@ from PyQt6.QtCore import Qt, pyqtSignal
 import config
 
 
+# 카운트 표시 Rich Text 템플릿 (색상은 고정이므로 모듈 로드 시 1회만 구성)
+# 기본 텍스트: text_secondary, 숫자: accent + font-weight: 600
+_NUMBER_STYLE = f"color: {config.COLORS['accent']}; font-weight: 600;"
+COUNT_HTML_TEMPLATE = (
+    f'<span style="color: {config.COLORS["text_secondary"]};">'
+    f'진행중: <span style="{_NUMBER_STYLE}">{{in_progress}}개</span> | '
+    f'완료: <span style="{_NUMBER_STYLE}">{{completed}}개</span> | '
+    f'전체: <span style="{_NUMBER_STYLE}">{{total}}개</span>'
+    '</span>'
+)
+
+
 class FooterWidget(QWidget):
     """Footer 위젯 - TODO 카운트 실시간 표시
 
@@ -35,6 +47,9 @@ class FooterWidget(QWidget):
         """
         super().__init__(parent)
 
+        # 마지막으로 표시한 카운트 (같은 값이면 Rich Text 재설정 생략)
+        self._last_counts = None
+
         self.setup_ui()
         self.apply_styles()
 
@@ -71,17 +86,14 @@ class FooterWidget(QWidget):
             in_progress: 진행중 TODO 개수
             completed: 완료 TODO 개수
         """
+        if self._last_counts == (in_progress, completed):
+            return
+        self._last_counts = (in_progress, completed)
+
         total = in_progress + completed
 
-        # Rich Text로 스타일 적용
-        # 기본 텍스트: text_secondary, 숫자: accent + font-weight: 600
-        html = f'''
-        <span style="color: {config.COLORS['text_secondary']};">
-            진행중: <span style="color: {config.COLORS['accent']}; font-weight: 600;">{in_progress}개</span> |
-            완료: <span style="color: {config.COLORS['accent']}; font-weight: 600;">{completed}개</span> |
-            전체: <span style="color: {config.COLORS['accent']}; font-weight: 600;">{total}개</span>
-        </span>
-        '''
+        # 미리 구성된 템플릿에 숫자만 채움
+        html = COUNT_HTML_TEMPLATE.format(in_progress=in_progress, completed=completed, total=total)
 
         self.count_label.setText(html)
 
@@ -49,6 +49,10 @@ class DraggableMixin:
         """
         self._drag_start_position: Optional[QPoint] = None
 
+        # MRO상 다음 클래스(QWidget 등)의 마우스 핸들러 존재 여부는 고정이므로 한 번만 확인
+        # (이벤트마다 hasattr(super(), ...) 반복 방지)
+        self._forward_mouse_events = hasattr(super(DraggableMixin, self), 'mouseMoveEvent')
+
     def mousePressEvent(self, event: QMouseEvent) -> None:
         """마우스 프레스 이벤트 핸들러
 
@@ -61,8 +65,8 @@ class DraggableMixin:
             if hasattr(self, 'drag_handle') and self._is_drag_handle_clicked(event.pos()):
                 self._drag_start_position = event.pos()
 
-        # Cooperative Multiple Inheritance: super()에 메서드가 있는지 확인 후 호출
-        if hasattr(super(), 'mousePressEvent'):
+        # Cooperative Multiple Inheritance: super()에 메서드가 있을 때만 호출 (setup_draggable에서 확인)
+        if self._forward_mouse_events:
             super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
@@ -73,27 +77,17 @@ class DraggableMixin:
         Args:
             event: 마우스 이벤트
         """
-        if not (event.buttons() & Qt.MouseButton.LeftButton):
-            # Cooperative Multiple Inheritance: super()에 메서드가 있는지 확인 후 호출
-            if hasattr(super(), 'mouseMoveEvent'):
-                super().mouseMoveEvent(event)
-            return
-        if self._drag_start_position is None:
-            # Cooperative Multiple Inheritance: super()에 메서드가 있는지 확인 후 호출
-            if hasattr(super(), 'mouseMoveEvent'):
-                super().mouseMoveEvent(event)
-            return
-
-        # 최소 드래그 거리 확인 (의도하지 않은 드래그 방지)
-        distance = (event.pos() - self._drag_start_position).manhattanLength()
-        if distance < 5:
-            # Cooperative Multiple Inheritance: super()에 메서드가 있는지 확인 후 호출
-            if hasattr(super(), 'mouseMoveEvent'):
-                super().mouseMoveEvent(event)
-            return
-
-        # 드래그 시작
-        self._start_drag()
+        if (event.buttons() & Qt.MouseButton.LeftButton) and self._drag_start_position is not None:
+            # 최소 드래그 거리 확인 (의도하지 않은 드래그 방지)
+            distance = (event.pos() - self._drag_start_position).manhattanLength()
+            if distance >= 5:
+                # 드래그 시작
+                self._start_drag()
+                return
+
+        # Cooperative Multiple Inheritance: super()에 메서드가 있을 때만 호출 (setup_draggable에서 확인)
+        if self._forward_mouse_events:
+            super().mouseMoveEvent(event)
 
     def _is_drag_handle_clicked(self, pos: QPoint) -> bool:
         """드래그 핸들 영역이 클릭되었는지 확인
@@ -115,7 +109,11 @@ class DraggableMixin:
         """드래그 시작
 
         QDrag 객체를 생성하고 드래그를 시작합니다.
+        마우스를 누를 때마다 한 번만 시작되며, 이후 이동 이벤트는 무시됩니다.
         """
+        # 시작 위치 초기화 (데이터가 없어 취소되는 경우에도 이동 이벤트마다 재시도하지 않도록)
+        self._drag_start_position = None
+
         # Mime Data 생성 (get_drag_data() 메서드 호출)
         drag_data = self.get_drag_data()
         if not drag_data:
@@ -141,7 +139,6 @@ class DraggableMixin:
         drop_action = drag.exec(Qt.DropAction.MoveAction)
 
         # 드래그 종료 후 원래 스타일로 복원
-        self._drag_start_position = None
         self.apply_styles()
 
     def get_drag_data(self) -> str:
@@ -7,25 +7,155 @@
 """
 
 from PyQt6.QtWidgets import QLabel, QMessageBox, QSizePolicy
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QCursor
+from PyQt6.QtCore import Qt, QEvent, pyqtSignal
+from PyQt6 import sip
 import webbrowser
 import os
 import subprocess
 import re
-from typing import List, Tuple
+import stat
+import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from ..utils.link_parser import LinkParser
 import config
 
 
+# 실행 파일 확장자 (클릭 시 실행 확인 대상)
+EXECUTABLE_EXTENSIONS = frozenset({'.exe', '.bat', '.cmd', '.com', '.scr', '.msi', '.ps1', '.vbs'})
+
+# 링크 타입별 <a> 태그 인라인 스타일
+LINK_STYLES = {
+    'url': 'color: #CC785C; text-decoration: underline;',  # URL: #CC785C, 밑줄
+    'path': 'color: #CC785C; text-decoration: underline; opacity: 0.8;',  # Path: 밑줄, opacity 0.8
+}
+
+# 링크 hover 스타일 (접힘 모드 HTML 앞에 추가)
+LINK_HOVER_STYLE = """
+        <style>
+        a[data-type="url"]:hover {
+            color: #E08B6F;
+        }
+        a[data-type="path"]:hover {
+            opacity: 1.0;
+        }
+        </style>
+        """
+
+# <br>, <br/>, <br /> 태그 패턴 (개행 정규화용)
+BR_TAG_PATTERN = re.compile(r'<br\s*/?>', re.IGNORECASE)
+
+# 파일/폴더 열기 실패 메시지 (Windows 오류 코드별)
+OPEN_ERROR_MESSAGES = {
+    2: "경로를 찾을 수 없습니다:\n{path}\n\n경로가 올바른지 확인해주세요.",
+    5: "접근할 수 없습니다:\n{path}\n\n접근 권한이 없거나 사용 중입니다.",
+    21: "드라이브를 사용할 수 없습니다:\n{path}\n\n네트워크 드라이브나 이동식 디스크의 연결 상태를 확인해주세요.",
+}
+
+# 경로 존재 확인 캐시 유효 시간 (초)
+PATH_EXISTS_TTL_SECONDS = 5
+
+
+@lru_cache(maxsize=256)
+def _cached_path_kind(path: str, bucket: int) -> Optional[str]:
+    """경로 종류 조회 (bucket이 바뀔 때까지 결과 재사용).
+
+    stat 1회로 존재 여부와 파일/폴더 구분을 함께 확인합니다.
+
+    Args:
+        path: 확인할 경로
+        bucket: 시간 구간 (PATH_EXISTS_TTL_SECONDS 단위)
+
+    Returns:
+        'file', 'dir' 또는 'other' (경로가 없으면 None)
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        return None
+
+    if stat.S_ISDIR(mode):
+        return 'dir'
+    if stat.S_ISREG(mode):
+        return 'file'
+    return 'other'
+
+
+def _get_path_kind(path: str) -> Optional[str]:
+    """경로 종류 확인 (짧은 TTL 캐시 사용).
+
+    같은 링크를 연달아 클릭할 때 파일 시스템 조회를 반복하지 않습니다.
+
+    Args:
+        path: 확인할 경로
+
+    Returns:
+        'file', 'dir' 또는 'other' (경로가 없으면 None)
+    """
+    return _cached_path_kind(path, int(time.time()) // PATH_EXISTS_TTL_SECONDS)
+
+
+# 네트워크 경로(UNC)의 존재 확인은 응답 없는 서버에서 오래 걸릴 수 있으므로
+# UI 스레드를 막지 않도록 백그라운드에서 수행
+_path_check_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="PathCheck")
+
+
+def _get_unc_server(path: str) -> Optional[str]:
+    """UNC 경로(\\\\server\\share)에서 서버 이름 추출.
+
+    확장 길이 경로(\\\\?\\C:\\...)와 장치 경로(\\\\.\\...)는 로컬 경로로 취급합니다.
+
+    Args:
+        path: 파일 또는 폴더 경로
+
+    Returns:
+        서버 이름 (UNC 경로가 아니면 None)
+    """
+    if path[:8].upper() == '\\\\?\\UNC\\':
+        unc_path = path[8:]
+    elif path.startswith(('\\\\?\\', '\\\\.\\')):
+        return None
+    elif path.startswith('\\\\'):
+        unc_path = path[2:]
+    else:
+        return None
+    server = unc_path.split('\\', 1)[0]
+    return server or None
+
+
+# 기본 프로그램으로 파일/폴더 열기 (플랫폼 분기는 임포트 시 1회만 수행)
+if sys.platform == 'win32':
+    _open_with_default_app = os.startfile
+else:
+    _OPEN_COMMAND = 'open' if sys.platform == 'darwin' else 'xdg-open'
+
+    def _open_with_default_app(path: str) -> None:
+        """기본 프로그램으로 파일/폴더 열기 (Windows 외 플랫폼).
+
+        실행기 종료를 기다리지 않도록 분리된 세션으로 띄웁니다 (UI 멈춤 방지).
+
+        Args:
+            path: 파일 또는 폴더 경로
+        """
+        subprocess.Popen(
+            [_OPEN_COMMAND, path],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+
+
 class RichTextWidget(QLabel):
     """링크/경로를 인식하고 클릭 가능하게 만드는 위젯."""
 
     # 시그널
     link_clicked = pyqtSignal(str, str)  # (타입, 텍스트)
+    _path_check_finished = pyqtSignal(str, object)  # (경로, 경로 종류 또는 None) - 백그라운드 → UI 스레드
 
     # 실행 파일 확장자
-    EXECUTABLE_EXTENSIONS = ['.exe', '.bat', '.cmd', '.com', '.scr', '.msi', '.ps1', '.vbs']
+    EXECUTABLE_EXTENSIONS = EXECUTABLE_EXTENSIONS
 
     def __init__(self, text: str = "", parent=None):
         """초기화.
@@ -39,8 +169,19 @@ class RichTextWidget(QLabel):
         self._expanded = False  # 펼침 상태
         self.links = []
 
-        # Rich Text 포맷 설정
-        self.setTextFormat(Qt.TextFormat.RichText)
+        # 링크 파싱 캐시 (resize/show마다 같은 텍스트를 다시 파싱하지 않도록)
+        self._links_cache_key = None
+        self._links_cache: List[Tuple[str, str, int, int]] = []
+
+        # 마지막 렌더링 조건 (펼침 여부, 원본 텍스트, 가용 너비) - 같으면 HTML/툴팁 재설정 생략
+        self._render_key = None
+
+        # 접힘 모드 1줄 텍스트와 측정 너비 캐시 (원본 텍스트, 1줄 텍스트, 픽셀 너비)
+        # 창 크기 조절 중에는 너비 비교만 다시 하고 전체 텍스트 측정은 건너뜀
+        self._line_metrics: Optional[Tuple[str, str, int]] = None
+
+        # 텍스트 포맷: 링크가 있을 때만 Rich Text (_set_display_text에서 전환)
+        self.setTextFormat(Qt.TextFormat.PlainText)
         self.setOpenExternalLinks(False)  # 수동 처리
 
         # 1줄 고정 높이 및 줄바꿈 비활성화
@@ -54,9 +195,18 @@ class RichTextWidget(QLabel):
 
         # 링크 클릭 시그널 연결
         self.linkActivated.connect(self._on_link_activated)
+        self._path_check_finished.connect(self._on_path_check_finished)
 
-        # 커서 변경 (링크 위에서 포인터로 변경)
-        self.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
+        # 링크 타입별 처리기
+        self._link_handlers = {
+            'url': self._open_url,
+            'path': self._open_path,
+        }
+
+        # 커서 설정: 기본은 화살표, 링크 위 포인터 전환은 QLabel이 앵커 hover 시 내부에서 처리
+        # (마우스 이동마다 Python 콜백으로 커서를 바꾸지 않음)
+        self.setTextInteractionFlags(Qt.TextInteractionFlag.LinksAccessibleByMouse)
+        self.setCursor(Qt.CursorShape.ArrowCursor)
 
         # 텍스트 업데이트
         self.update_text(text)
@@ -70,6 +220,20 @@ class RichTextWidget(QLabel):
         self.raw_text = text
         self._update_elided_text()
 
+    def _parse_links(self, text: str) -> List[Tuple[str, str, int, int]]:
+        """링크/경로 파싱 (텍스트가 같으면 캐시된 결과 반환).
+
+        Args:
+            text: 파싱할 텍스트
+
+        Returns:
+            [(타입, 텍스트, 시작, 끝), ...] 형식의 링크 리스트
+        """
+        if self._links_cache_key != text:
+            self._links_cache = LinkParser.parse_text(text)
+            self._links_cache_key = text
+        return self._links_cache
+
     def _convert_to_html(self, display_text: str, original_links: List[Tuple[str, str, int, int]]) -> str:
         """텍스트를 HTML로 변환 (링크/경로 하이라이트).
 
@@ -119,22 +283,7 @@ class RichTextWidget(QLabel):
             href = f"{link_type}:{original_link_text}"
 
             # URL과 Path에 따라 다른 스타일 적용
-            if link_type == 'url':
-                # URL: #CC785C, 밑줄
-                result.append(
-                    f'<a href="{self._escape_html(href)}" '
-                    f'style="color: #CC785C; text-decoration: underline;" '
-                    f'data-type="url">'
-                    f'{self._escape_html(display_link_text)}</a>'
-                )
-            else:  # path
-                # Path: #CC785C, 밑줄, opacity 0.8
-                result.append(
-                    f'<a href="{self._escape_html(href)}" '
-                    f'style="color: #CC785C; text-decoration: underline; opacity: 0.8;" '
-                    f'data-type="path">'
-                    f'{self._escape_html(display_link_text)}</a>'
-                )
+            result.append(self._build_anchor(link_type, href, self._escape_html(display_link_text)))
 
             last_end = display_end
 
@@ -143,19 +292,24 @@ class RichTextWidget(QLabel):
             result.append(self._escape_html(display_text[last_end:]))
 
         # 스타일 추가
-        html = f"""
-        <style>
-        a[data-type="url"]:hover {{
-            color: #E08B6F;
-        }}
-        a[data-type="path"]:hover {{
-            opacity: 1.0;
-        }}
-        </style>
-        {''.join(result)}
-        """
+        return f"{LINK_HOVER_STYLE}{''.join(result)}"
 
-        return html
+    def _build_anchor(self, link_type: str, href: str, inner_html: str) -> str:
+        """링크 <a> 태그 생성.
+
+        Args:
+            link_type: 링크 타입 ('url' 또는 'path')
+            href: "type:text" 형식의 링크 데이터
+            inner_html: 태그 안에 표시할 (이스케이프된) HTML
+
+        Returns:
+            <a> 태그 문자열
+        """
+        return (
+            f'<a href="{self._escape_html(href)}" '
+            f'style="{LINK_STYLES.get(link_type, LINK_STYLES["path"])}" '
+            f'data-type="{link_type}">{inner_html}</a>'
+        )
 
     def _escape_html(self, text: str) -> str:
         """HTML 특수문자 이스케이프.
@@ -188,11 +342,10 @@ class RichTextWidget(QLabel):
         # 시그널 발생
         self.link_clicked.emit(link_type, link_text)
 
-        # 타입에 따라 처리
-        if link_type == 'url':
-            self._open_url(link_text)
-        elif link_type == 'path':
-            self._open_path(link_text)
+        # 타입에 따라 처리 (알 수 없는 타입은 무시)
+        handler = self._link_handlers.get(link_type)
+        if handler:
+            handler(link_text)
 
     def _open_url(self, url: str):
         """URL을 기본 브라우저에서 열기.
@@ -216,11 +369,56 @@ class RichTextWidget(QLabel):
     def _open_path(self, path: str):
         """파일/폴더 열기.
 
+        네트워크 경로는 존재 확인(stat)을 백그라운드에서 수행한 뒤 UI 스레드에서 이어서 엽니다.
+        응답 없는 서버를 조회하느라 창이 멈추지 않습니다.
+
+        Args:
+            path: 파일 또는 폴더 경로
+        """
+        # 문자열 경로로 1회 정규화 (캐시 키 통일, 이후 단계는 같은 문자열 재사용)
+        path = os.path.normpath(path)
+
+        if _get_unc_server(path):
+            future = _path_check_executor.submit(_get_path_kind, path)
+            future.add_done_callback(lambda f: self._emit_path_check_result(path, f))
+            return
+
+        # 로컬 경로: 존재 확인 (파일/폴더 구분도 함께 조회)
+        self._open_checked_path(path, _get_path_kind(path))
+
+    def _emit_path_check_result(self, path: str, future: Future):
+        """경로 확인 결과를 UI 스레드로 전달 (백그라운드 스레드에서 호출).
+
+        Args:
+            path: 열려는 경로
+            future: 경로 확인 작업
+        """
+        # 확인 도중 위젯이 삭제되었으면 아무것도 하지 않음
+        if sip.isdeleted(self):
+            return
+        try:
+            self._path_check_finished.emit(path, future.result())
+        except RuntimeError:
+            # isdeleted 확인 직후 위젯이 삭제된 경우
+            pass
+
+    def _on_path_check_finished(self, path: str, path_kind: Optional[str]):
+        """백그라운드 경로 확인 완료 처리 (UI 스레드).
+
+        Args:
+            path: 열려는 경로
+            path_kind: 'file', 'dir', 'other' 또는 None (경로 없음/서버 응답 없음)
+        """
+        self._open_checked_path(path, path_kind)
+
+    def _open_checked_path(self, path: str, path_kind: Optional[str]):
+        """존재 확인이 끝난 파일/폴더 열기 (실행 파일 검증 포함).
+
         Args:
             path: 파일 또는 폴더 경로
+            path_kind: _get_path_kind 결과 (경로가 없으면 None)
         """
-        # 경로 존재 확인
-        if not os.path.exists(path):
+        if path_kind is None:
             QMessageBox.warning(
                 self,
                 "경로 없음",
@@ -229,19 +427,20 @@ class RichTextWidget(QLabel):
             return
 
         # 실행 파일 검증
-        if os.path.isfile(path) and self._is_executable(path):
+        if path_kind == 'file' and self._is_executable(path):
             if not self._confirm_executable(path):
                 return
 
-        # Windows에서 파일/폴더 열기
+        # 기본 프로그램으로 파일/폴더 열기
         try:
-            os.startfile(path)
+            _open_with_default_app(path)
         except Exception as e:
-            QMessageBox.warning(
-                self,
-                "파일 열기 실패",
-                f"파일을 열 수 없습니다:\n{path}\n\n오류: {str(e)}"
-            )
+            template = OPEN_ERROR_MESSAGES.get(getattr(e, 'winerror', None))
+            if template:
+                message = template.format(path=path)
+            else:
+                message = f"파일을 열 수 없습니다:\n{path}\n\n오류: {str(e)}"
+            QMessageBox.warning(self, "파일 열기 실패", message)
 
     def _is_executable(self, file_path: str) -> bool:
         """실행 파일 여부 확인.
@@ -334,7 +533,7 @@ class RichTextWidget(QLabel):
             정규화된 텍스트 (\\n만 포함)
         """
         # <br>, <br/>, <br /> 처리
-        text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
+        text = BR_TAG_PATTERN.sub('\n', text)
         # \r\n -> \n, \r -> \n
         text = text.replace('\r\n', '\n').replace('\r', '\n')
         return text
@@ -368,18 +567,7 @@ class RichTextWidget(QLabel):
             display_link = self._escape_html(link_text).replace('\n', '<br>')
             href = f"{link_type}:{link_text}"
 
-            if link_type == 'url':
-                result.append(
-                    f'<a href="{self._escape_html(href)}" '
-                    f'style="color: #CC785C; text-decoration: underline;" '
-                    f'data-type="url">{display_link}</a>'
-                )
-            else:
-                result.append(
-                    f'<a href="{self._escape_html(href)}" '
-                    f'style="color: #CC785C; text-decoration: underline; opacity: 0.8;" '
-                    f'data-type="path">{display_link}</a>'
-                )
+            result.append(self._build_anchor(link_type, href, display_link))
 
             last_end = end
 
@@ -395,6 +583,13 @@ class RichTextWidget(QLabel):
         펼침 모드: 개행문자를 실제 줄바꿈으로 표시
         접힘 모드: 개행문자를 공백으로 치환하여 1줄 표시
         """
+        # 펼침 모드는 너비와 무관 (줄바꿈은 QLabel이 처리), 접힘 모드는 너비별로 elide 결과가 다름
+        available_width = None if self._expanded else self.width() - 10
+        render_key = (self._expanded, self.raw_text, available_width)
+        if render_key == self._render_key:
+            return
+        self._render_key = render_key
+
         if not self.raw_text:
             self.setText("")
             self.setToolTip("")
@@ -405,22 +600,21 @@ class RichTextWidget(QLabel):
             normalized_text = self._normalize_newlines(self.raw_text)
 
             # 링크 파싱 (정규화된 텍스트에서)
-            self.links = LinkParser.parse_text(normalized_text)
+            self.links = self._parse_links(normalized_text)
 
-            # HTML 변환 (개행을 <br>로)
-            html = self._convert_to_html_expanded(normalized_text, self.links)
-            self.setText(html)
+            if self.links:
+                # HTML 변환 (개행을 <br>로)
+                self._set_display_text(self._convert_to_html_expanded(normalized_text, self.links), rich=True)
+            else:
+                self._set_display_text(normalized_text, rich=False)
             self.setToolTip("")  # 펼침 모드에서는 툴팁 불필요
         else:
             # 접힘 모드: 기존 로직 (개행→공백, 1줄)
-            single_line_text = self.raw_text.replace('\n', ' ').replace('\r', ' ')
-
-            available_width = self.width() - 10
-            fm = self.fontMetrics()
+            single_line_text, text_width = self._get_line_metrics()
 
             # 텍스트가 넘치면 elide, 아니면 원본
-            if fm.horizontalAdvance(single_line_text) > available_width:
-                display_text = fm.elidedText(single_line_text, Qt.TextElideMode.ElideRight, available_width)
+            if text_width > available_width:
+                display_text = self.fontMetrics().elidedText(single_line_text, Qt.TextElideMode.ElideRight, available_width)
                 self.setToolTip(self.raw_text)  # 툴팁에는 원본 텍스트 (개행 포함)
             else:
                 display_text = single_line_text
@@ -431,11 +625,39 @@ class RichTextWidget(QLabel):
                     self.setToolTip("")
 
             # 원본 텍스트(single_line_text)에서 링크 파싱 - 원본 링크 정보 보존
-            self.links = LinkParser.parse_text(single_line_text)
+            self.links = self._parse_links(single_line_text)
+
+            if self.links:
+                # HTML 변환 시 display_text 사용하되, 링크는 원본 사용
+                self._set_display_text(self._convert_to_html(display_text, self.links), rich=True)
+            else:
+                self._set_display_text(display_text, rich=False)
 
-            # HTML 변환 시 display_text 사용하되, 링크는 원본 사용
-            html = self._convert_to_html(display_text, self.links)
-            self.setText(html)
+    def _get_line_metrics(self) -> Tuple[str, int]:
+        """접힘 모드용 1줄 텍스트와 그 픽셀 너비 반환 (원본 텍스트가 같으면 캐시 사용).
+
+        Returns:
+            Tuple[str, int]: (개행을 공백으로 바꾼 텍스트, 현재 폰트 기준 너비)
+        """
+        if self._line_metrics is None or self._line_metrics[0] != self.raw_text:
+            single_line_text = self.raw_text.replace('\n', ' ').replace('\r', ' ')
+            text_width = self.fontMetrics().horizontalAdvance(single_line_text)
+            self._line_metrics = (self.raw_text, single_line_text, text_width)
+        return self._line_metrics[1], self._line_metrics[2]
+
+    def _set_display_text(self, text: str, rich: bool) -> None:
+        """표시 텍스트 설정 (링크가 없으면 Plain Text로 표시).
+
+        링크 없는 일반 할일은 HTML 변환과 Rich Text 문서 생성을 건너뜁니다.
+
+        Args:
+            text: HTML 문자열(rich=True) 또는 일반 텍스트(rich=False)
+            rich: Rich Text 여부
+        """
+        text_format = Qt.TextFormat.RichText if rich else Qt.TextFormat.PlainText
+        if self.textFormat() != text_format:
+            self.setTextFormat(text_format)
+        self.setText(text)
 
     def resizeEvent(self, event):
         """위젯 크기 변경 시 텍스트 다시 elide 처리.
@@ -447,6 +669,17 @@ class RichTextWidget(QLabel):
         if hasattr(self, 'raw_text'):
             self._update_elided_text()
 
+    def changeEvent(self, event):
+        """폰트 변경 시 elide 결과와 텍스트 너비가 달라지므로 렌더링/측정 캐시 무효화.
+
+        Args:
+            event: change 이벤트
+        """
+        if event.type() == QEvent.Type.FontChange:
+            self._render_key = None
+            self._line_metrics = None
+        super().changeEvent(event)
+
     def showEvent(self, event):
         """위젯 표시 시 텍스트 elide 처리.
 
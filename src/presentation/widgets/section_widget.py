@@ -9,11 +9,15 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollAr
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QDragEnterEvent, QDragMoveEvent, QDropEvent
 from typing import List
+import json
+import logging
 
 import config
 from ...domain.entities.todo import Todo
 from .todo_item_widget import TodoItemWidget
 
+logger = logging.getLogger(__name__)
+
 
 class SectionWidget(QWidget):
     """TODO 섹션 위젯
@@ -155,6 +159,83 @@ class SectionWidget(QWidget):
         Args:
             todo: Todo Entity
         """
+        todo_item = self._create_todo_item(todo)
+
+        # 레이아웃에 추가 (stretch 위에)
+        self.items_layout.insertWidget(len(self.todo_items), todo_item)
+        self.todo_items.append(todo_item)
+        # Phase 1: todo_widgets 딕셔너리에 추가
+        self.todo_widgets[str(todo.id)] = todo_item
+
+        # 카운트 업데이트
+        self.update_count()
+
+    def sync_todos(self, todos: List[Todo]) -> None:
+        """TODO 목록 동기화 (변경된 항목만 위젯 재생성)
+
+        todo_id 기준으로 기존 위젯을 재사용하고, 표시 내용이 바뀐 항목만 다시 생성합니다.
+        새 항목은 생성하고 사라진 항목은 제거한 뒤, 레이아웃 순서를 todos 순서에 맞춥니다.
+
+        Args:
+            todos: 표시할 Todo Entity 리스트 (표시 순서)
+        """
+        # 일괄 변경 동안 화면 갱신 중단 → 마지막에 한 번만 다시 그림
+        self.setUpdatesEnabled(False)
+        try:
+            self._sync_todo_items(todos)
+        finally:
+            self.setUpdatesEnabled(True)
+
+        # 카운트 업데이트
+        self.update_count()
+
+    def _sync_todo_items(self, todos: List[Todo]) -> None:
+        """sync_todos의 위젯 재사용/생성/제거 및 순서 조정 본체
+
+        Args:
+            todos: 표시할 Todo Entity 리스트 (표시 순서)
+        """
+        incoming_ids = {str(todo.id) for todo in todos}
+
+        # 1. 사라진 항목 제거
+        for todo_id in [tid for tid in self.todo_widgets if tid not in incoming_ids]:
+            self._destroy_todo_item(self.todo_widgets.pop(todo_id))
+
+        # 2. 재사용/재생성/생성 후 순서 맞추기
+        new_items: List[TodoItemWidget] = []
+        for position, todo in enumerate(todos):
+            todo_id = str(todo.id)
+            todo_item = self.todo_widgets.get(todo_id)
+
+            if todo_item is not None and todo_item.render_key != TodoItemWidget.build_render_key(todo):
+                # 표시 내용 변경 → 위젯 재생성
+                self._destroy_todo_item(todo_item)
+                todo_item = None
+
+            if todo_item is None:
+                todo_item = self._create_todo_item(todo)
+                self.todo_widgets[todo_id] = todo_item
+            else:
+                # 표시 내용 동일 → 최신 Entity 참조만 교체
+                todo_item.todo = todo
+
+            if self.items_layout.indexOf(todo_item) != position:
+                self.items_layout.removeWidget(todo_item)
+                self.items_layout.insertWidget(position, todo_item)
+
+            new_items.append(todo_item)
+
+        self.todo_items = new_items
+
+    def _create_todo_item(self, todo: Todo) -> TodoItemWidget:
+        """TodoItemWidget 생성 및 시그널 연결
+
+        Args:
+            todo: Todo Entity
+
+        Returns:
+            TodoItemWidget: 생성된 위젯 (레이아웃에는 추가하지 않음)
+        """
         # TodoItemWidget 생성
         todo_item = TodoItemWidget(todo)
 
@@ -183,14 +264,16 @@ class SectionWidget(QWidget):
         # 하위 할일 다른 부모로 이동 시그널 연결
         todo_item.subtask_moved.connect(self.subtask_moved_requested.emit)
 
-        # 레이아웃에 추가 (stretch 위에)
-        self.items_layout.insertWidget(len(self.todo_items), todo_item)
-        self.todo_items.append(todo_item)
-        # Phase 1: todo_widgets 딕셔너리에 추가
-        self.todo_widgets[str(todo.id)] = todo_item
+        return todo_item
 
-        # 카운트 업데이트
-        self.update_count()
+    def _destroy_todo_item(self, todo_item: TodoItemWidget) -> None:
+        """TodoItemWidget을 레이아웃에서 제거하고 삭제 예약
+
+        Args:
+            todo_item: 제거할 위젯
+        """
+        self.items_layout.removeWidget(todo_item)
+        todo_item.deleteLater()
 
     def remove_todo(self, todo_id: str) -> None:
         """TODO 아이템 제거
@@ -198,25 +281,25 @@ class SectionWidget(QWidget):
         Args:
             todo_id: TODO ID
         """
-        for i, todo_item in enumerate(self.todo_items):
-            if str(todo_item.todo.id) == todo_id:
-                # 레이아웃에서 제거
-                self.items_layout.removeWidget(todo_item)
-                todo_item.deleteLater()
+        # Phase 1: todo_widgets 딕셔너리로 바로 조회 (없으면 이 섹션의 항목이 아님)
+        todo_item = self.todo_widgets.pop(todo_id, None)
+        if todo_item is None:
+            return
+
+        # 레이아웃에서 제거
+        self._destroy_todo_item(todo_item)
 
-                # 리스트에서 제거
-                self.todo_items.pop(i)
-                # Phase 1: todo_widgets 딕셔너리에서 제거
-                self.todo_widgets.pop(todo_id, None)
+        # 리스트에서 제거
+        self.todo_items.remove(todo_item)
 
-                # 카운트 업데이트
-                self.update_count()
-                break
+        # 카운트 업데이트
+        self.update_count()
 
     def update_count(self) -> None:
         """카운트 업데이트"""
-        count = len(self.todo_items)
-        self.count_label.setText(str(count))
+        count_text = str(len(self.todo_items))
+        if self.count_label.text() != count_text:
+            self.count_label.setText(count_text)
 
     def clear_all(self) -> None:
         """모든 TODO 제거"""
@@ -353,9 +436,6 @@ class SectionWidget(QWidget):
         Args:
             event: 드롭 이벤트
         """
-        import logging
-        logger = logging.getLogger(__name__)
-
         # Mime Data에서 TODO ID 추출
         todo_id = event.mimeData().text()
         if not todo_id:
@@ -363,7 +443,6 @@ class SectionWidget(QWidget):
             return
 
         # subtask 드래그 데이터는 무시 (JSON 형식)
-        import json
         try:
             data = json.loads(todo_id)
             if isinstance(data, dict) and data.get('type') == 'subtask':
@@ -10,6 +10,7 @@ from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QMouseEvent
 import json
 import re
+from functools import lru_cache
 
 import config
 from ...domain.entities.subtask import SubTask
@@ -18,6 +19,140 @@ from ...domain.value_objects.due_date import DueDateStatus
 from .rich_text_widget import RichTextWidget
 from .mixins.draggable_mixin import DraggableMixin
 
+# 개행문자(\n, \r) 또는 <br> 태그 감지 패턴
+MULTILINE_PATTERN = re.compile(r'[\n\r]|<br\s*/?>', re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
+def _build_style_sheet() -> str:
+    """QSS 문자열 생성 (config 값이 고정이므로 1회만 생성)
+
+    완료 스타일은 텍스트 라벨의 completed 동적 속성 선택자로 분기하므로
+    완료 상태가 바뀌어도 스타일 시트는 동일합니다.
+
+    Returns:
+        str: 위젯 스타일 시트
+    """
+    style_sheet = f"""
+    QWidget#subtaskItem {{
+        background: transparent;
+        border: none;
+    }}
+
+    QWidget#subtaskItem:hover {{
+        background: rgba(64, 64, 64, 0.1);
+        border-radius: {config.UI_METRICS['border_radius']['lg']}px;
+    }}
+
+    QLabel#subtaskDragHandle {{
+        color: {config.COLORS['text_disabled']};
+        font-size: {config.FONT_SIZES['base']}px;
+    }}
+
+    QCheckBox#subtaskCheckbox {{
+        width: {config.WIDGET_SIZES['checkbox_size'][0]}px;
+        height: {config.WIDGET_SIZES['checkbox_size'][1]}px;
+        border: {config.UI_METRICS['border_width']['medium']}px solid {config.COLORS['border']};
+        border-radius: {config.UI_METRICS['border_radius']['sm']}px;
+        background: transparent;
+    }}
+
+    QCheckBox#subtaskCheckbox:hover {{
+        border-color: {config.COLORS['accent']};
+    }}
+
+    QCheckBox#subtaskCheckbox:checked {{
+        background: {config.COLORS['accent']};
+        border-color: {config.COLORS['accent']};
+    }}
+
+    QCheckBox#subtaskCheckbox::indicator {{
+        width: {config.WIDGET_SIZES['checkbox_size'][0] - 4}px;
+        height: {config.WIDGET_SIZES['checkbox_size'][1] - 4}px;
+    }}
+
+    QCheckBox#subtaskCheckbox::indicator:checked {{
+        image: none;
+    }}
+
+    QLabel#subtaskText {{
+        color: {config.COLORS['text_secondary']};
+        font-size: {config.FONT_SIZES['sm']}px;
+        line-height: 1.4;
+        text-decoration: none;
+    }}
+
+    QLabel#subtaskText[completed="true"] {{
+        color: {config.COLORS['text_disabled']};
+        text-decoration: line-through;
+    }}
+
+    QPushButton#subtaskDeleteBtn {{
+        background: transparent;
+        border: none;
+        color: {config.COLORS['text_disabled']};
+        font-size: {config.FONT_SIZES['lg']}px;
+        padding: {config.UI_METRICS['padding']['sm'][0]}px {config.UI_METRICS['padding']['sm'][1]}px;
+        border-radius: {config.UI_METRICS['border_radius']['sm']}px;
+    }}
+
+    QPushButton#subtaskDeleteBtn:hover {{
+        background: rgba(244, 67, 54, 0.15);
+        color: #ef5350;
+    }}
+
+    QLabel#subtaskDateBadge {{
+        font-size: {config.FONT_SIZES['xs']}px;
+        padding: {config.UI_METRICS['padding']['xs'][0]}px {config.UI_METRICS['padding']['xs'][1]}px;
+        border-radius: {config.UI_METRICS['border_radius']['sm']}px;
+        font-weight: 500;
+    }}
+
+    QLabel#subtaskDateBadge[status="overdue_severe"] {{
+        background: {config.DUE_DATE_COLORS['overdue_severe']['bg']};
+        color: {config.DUE_DATE_COLORS['overdue_severe']['color']};
+    }}
+
+    QLabel#subtaskDateBadge[status="overdue_moderate"] {{
+        background: {config.DUE_DATE_COLORS['overdue_moderate']['bg']};
+        color: {config.DUE_DATE_COLORS['overdue_moderate']['color']};
+    }}
+
+    QLabel#subtaskDateBadge[status="overdue_mild"] {{
+        background: {config.DUE_DATE_COLORS['overdue_mild']['bg']};
+        color: {config.DUE_DATE_COLORS['overdue_mild']['color']};
+    }}
+
+    QLabel#subtaskDateBadge[status="today"] {{
+        background: {config.DUE_DATE_COLORS['today']['bg']};
+        color: {config.DUE_DATE_COLORS['today']['color']};
+    }}
+
+    QLabel#subtaskDateBadge[status="upcoming"] {{
+        background: {config.DUE_DATE_COLORS['upcoming']['bg']};
+        color: {config.DUE_DATE_COLORS['upcoming']['color']};
+    }}
+
+    QLabel#subtaskDateBadge[status="normal"] {{
+        background: {config.DUE_DATE_COLORS['normal']['bg']};
+        color: {config.DUE_DATE_COLORS['normal']['color']};
+    }}
+
+    QPushButton#subtaskExpandBtn {{
+        background: transparent;
+        border: none;
+        color: {config.COLORS['text_disabled']};
+        font-size: 10px;
+        padding: 0;
+    }}
+
+    QPushButton#subtaskExpandBtn:hover {{
+        color: {config.COLORS['accent']};
+    }}
+    """
+
+    return style_sheet
+
 
 class SubTaskWidget(DraggableMixin, QWidget):
     """하위 할일 아이템 위젯
@@ -53,6 +188,7 @@ class SubTaskWidget(DraggableMixin, QWidget):
         self.parent_todo_id = parent_todo_id
         self.subtask = subtask
         self._is_hovered = False
+        self._effects_completed = None  # opacity 효과가 적용된 완료 상태 (None: 미적용)
 
         # DraggableMixin 초기화
         self.setup_draggable()
@@ -177,132 +313,20 @@ class SubTaskWidget(DraggableMixin, QWidget):
         if not self.subtask.due_date:
             return ("", "normal")
 
-        # DueDate Value Object 메서드 활용
-        status = self.subtask.due_date.calculate_status()
-        text = self.subtask.due_date.format_display_text()
-
-        return (text, status)
+        # DueDate Value Object 메서드 활용 (현재 시각 1회 조회)
+        return self.subtask.due_date.display_info()
 
     def _apply_styles(self) -> None:
         """QSS 스타일 적용"""
-        # 완료 상태에 따른 텍스트 스타일
-        text_decoration = "line-through" if self.subtask.completed else "none"
-        text_color = config.COLORS['text_disabled'] if self.subtask.completed else config.COLORS['text_secondary']
-
-        style_sheet = f"""
-        QWidget#subtaskItem {{
-            background: transparent;
-            border: none;
-        }}
-
-        QWidget#subtaskItem:hover {{
-            background: rgba(64, 64, 64, 0.1);
-            border-radius: {config.UI_METRICS['border_radius']['lg']}px;
-        }}
-
-        QLabel#subtaskDragHandle {{
-            color: {config.COLORS['text_disabled']};
-            font-size: {config.FONT_SIZES['base']}px;
-        }}
-
-        QCheckBox#subtaskCheckbox {{
-            width: {config.WIDGET_SIZES['checkbox_size'][0]}px;
-            height: {config.WIDGET_SIZES['checkbox_size'][1]}px;
-            border: {config.UI_METRICS['border_width']['medium']}px solid {config.COLORS['border']};
-            border-radius: {config.UI_METRICS['border_radius']['sm']}px;
-            background: transparent;
-        }}
-
-        QCheckBox#subtaskCheckbox:hover {{
-            border-color: {config.COLORS['accent']};
-        }}
-
-        QCheckBox#subtaskCheckbox:checked {{
-            background: {config.COLORS['accent']};
-            border-color: {config.COLORS['accent']};
-        }}
-
-        QCheckBox#subtaskCheckbox::indicator {{
-            width: {config.WIDGET_SIZES['checkbox_size'][0] - 4}px;
-            height: {config.WIDGET_SIZES['checkbox_size'][1] - 4}px;
-        }}
-
-        QCheckBox#subtaskCheckbox::indicator:checked {{
-            image: none;
-        }}
-
-        QLabel#subtaskText {{
-            color: {text_color};
-            font-size: {config.FONT_SIZES['sm']}px;
-            line-height: 1.4;
-            text-decoration: {text_decoration};
-        }}
-
-        QPushButton#subtaskDeleteBtn {{
-            background: transparent;
-            border: none;
-            color: {config.COLORS['text_disabled']};
-            font-size: {config.FONT_SIZES['lg']}px;
-            padding: {config.UI_METRICS['padding']['sm'][0]}px {config.UI_METRICS['padding']['sm'][1]}px;
-            border-radius: {config.UI_METRICS['border_radius']['sm']}px;
-        }}
-
-        QPushButton#subtaskDeleteBtn:hover {{
-            background: rgba(244, 67, 54, 0.15);
-            color: #ef5350;
-        }}
-
-        QLabel#subtaskDateBadge {{
-            font-size: {config.FONT_SIZES['xs']}px;
-            padding: {config.UI_METRICS['padding']['xs'][0]}px {config.UI_METRICS['padding']['xs'][1]}px;
-            border-radius: {config.UI_METRICS['border_radius']['sm']}px;
-            font-weight: 500;
-        }}
-
-        QLabel#subtaskDateBadge[status="overdue_severe"] {{
-            background: {config.DUE_DATE_COLORS['overdue_severe']['bg']};
-            color: {config.DUE_DATE_COLORS['overdue_severe']['color']};
-        }}
-
-        QLabel#subtaskDateBadge[status="overdue_moderate"] {{
-            background: {config.DUE_DATE_COLORS['overdue_moderate']['bg']};
-            color: {config.DUE_DATE_COLORS['overdue_moderate']['color']};
-        }}
-
-        QLabel#subtaskDateBadge[status="overdue_mild"] {{
-            background: {config.DUE_DATE_COLORS['overdue_mild']['bg']};
-            color: {config.DUE_DATE_COLORS['overdue_mild']['color']};
-        }}
-
-        QLabel#subtaskDateBadge[status="today"] {{
-            background: {config.DUE_DATE_COLORS['today']['bg']};
-            color: {config.DUE_DATE_COLORS['today']['color']};
-        }}
-
-        QLabel#subtaskDateBadge[status="upcoming"] {{
-            background: {config.DUE_DATE_COLORS['upcoming']['bg']};
-            color: {config.DUE_DATE_COLORS['upcoming']['color']};
-        }}
-
-        QLabel#subtaskDateBadge[status="normal"] {{
-            background: {config.DUE_DATE_COLORS['normal']['bg']};
-            color: {config.DUE_DATE_COLORS['normal']['color']};
-        }}
-
-        QPushButton#subtaskExpandBtn {{
-            background: transparent;
-            border: none;
-            color: {config.COLORS['text_disabled']};
-            font-size: 10px;
-            padding: 0;
-        }}
-
-        QPushButton#subtaskExpandBtn:hover {{
-            color: {config.COLORS['accent']};
-        }}
-        """
+        # 캐시된 스타일 시트 재사용, 동일하면 재적용 생략
+        style_sheet = _build_style_sheet()
+        if self.styleSheet() != style_sheet:
+            self.setStyleSheet(style_sheet)
 
-        self.setStyleSheet(style_sheet)
+        # 완료 상태가 그대로면 opacity 효과 재생성 생략 (드래그 종료 후 재적용 등)
+        if self._effects_completed == self.subtask.completed:
+            return
+        self._effects_completed = self.subtask.completed
 
         # 완료 상태면 개별 요소에 opacity 효과 적용 (삭제 버튼 제외)
         if self.subtask.completed:
@@ -405,7 +429,7 @@ class SubTaskWidget(DraggableMixin, QWidget):
         """
         text = str(self.subtask.content)
         # \n, \r, <br>, <br/>, <br /> 체크
-        return bool(re.search(r'[\n\r]|<br\s*/?>', text, re.IGNORECASE))
+        return bool(MULTILINE_PATTERN.search(text))
 
     def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
         """더블클릭 이벤트 핸들러 (편집 요청)
@@ -425,9 +449,11 @@ class SubTaskWidget(DraggableMixin, QWidget):
         Args:
             event: 이벤트 객체
         """
-        self._is_hovered = True
-        # Opacity로 부드럽게 표시
-        self.delete_btn_opacity.setOpacity(config.OPACITY_VALUES['visible'])
+        # 이미 호버 상태면 opacity 재설정(재페인트) 생략
+        if not self._is_hovered:
+            self._is_hovered = True
+            # Opacity로 부드럽게 표시
+            self.delete_btn_opacity.setOpacity(config.OPACITY_VALUES['visible'])
         super().enterEvent(event)
 
     def leaveEvent(self, event) -> None:
@@ -436,9 +462,10 @@ class SubTaskWidget(DraggableMixin, QWidget):
         Args:
             event: 이벤트 객체
         """
-        self._is_hovered = False
-        # Opacity로 부드럽게 숨김
-        self.delete_btn_opacity.setOpacity(config.OPACITY_VALUES['hidden'])
+        if self._is_hovered:
+            self._is_hovered = False
+            # Opacity로 부드럽게 숨김
+            self.delete_btn_opacity.setOpacity(config.OPACITY_VALUES['hidden'])
         super().leaveEvent(event)
 
     def _update_completion_style(self) -> None:
@@ -448,11 +475,13 @@ class SubTaskWidget(DraggableMixin, QWidget):
         else:
             self.subtask_text.setProperty("completed", "false")
 
-        # 스타일 재적용
+        # 텍스트 라벨만 다시 polish (링크 파싱/전체 스타일 시트 재적용 없음)
+        self.style().unpolish(self.subtask_text)
+        self.style().polish(self.subtask_text)
+        self.subtask_text.update()
+
+        # 완료 상태 opacity 효과 갱신
         self._apply_styles()
-        self.style().unpolish(self)
-        self.style().polish(self)
-        self.update()
 
     def get_drag_data(self) -> str:
         """드래그할 데이터 반환 (DraggableMixin 요구 메서드)
@@ -523,4 +552,6 @@ class SubTaskWidget(DraggableMixin, QWidget):
             self.expand_btn.setText("▶")
             self.subtask_text.set_expanded(False)
 
+        # 날짜 배지 등이 바뀌었을 수 있으므로 opacity 효과 다시 적용
+        self._effects_completed = None
         self._apply_styles()
@@ -10,7 +10,10 @@ from PyQt6.QtCore import Qt, pyqtSignal, QEvent
 from PyQt6.QtGui import QMouseEvent, QAction, QDragEnterEvent, QDragMoveEvent, QDropEvent
 from PyQt6.QtWidgets import QMenu
 import json
+import logging
 import re
+from functools import lru_cache
+from typing import Optional
 
 import config
 from ...domain.entities.todo import Todo
@@ -19,6 +22,199 @@ from .rich_text_widget import RichTextWidget
 from .mixins.draggable_mixin import DraggableMixin
 from .subtask_widget import SubTaskWidget
 
+logger = logging.getLogger(__name__)
+
+# 이벤트 필터가 처리하는 이벤트 타입 (그 외 이벤트는 즉시 통과)
+DRAG_DROP_EVENT_TYPES = frozenset({QEvent.Type.DragEnter, QEvent.Type.DragMove, QEvent.Type.Drop})
+
+# 개행문자(\n, \r) 또는 <br> 태그 감지 패턴
+MULTILINE_PATTERN = re.compile(r'[\n\r]|<br\s*/?>', re.IGNORECASE)
+
+
+@lru_cache(maxsize=8)
+def _parse_drag_payload(text: str) -> Optional[dict]:
+    """드래그 mime 텍스트를 파싱 (같은 드래그 동안에는 1회만 파싱)
+
+    DragMove 이벤트는 마우스 이동마다 발생하므로 매번 json.loads 하지 않도록 캐시합니다.
+    반환된 딕셔너리는 공유되므로 읽기 전용으로 사용해야 합니다.
+
+    Args:
+        text: mime 데이터 텍스트
+
+    Returns:
+        Optional[dict]: JSON 객체면 딕셔너리, 아니면 None (TODO ID 등)
+    """
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+@lru_cache(maxsize=1)
+def _build_style_sheet() -> str:
+    """QSS 문자열 생성 (config 값이 고정이므로 1회만 생성)
+
+    완료 스타일은 텍스트 라벨의 completed 동적 속성 선택자로 분기하므로
+    완료 상태가 바뀌어도 스타일 시트는 동일합니다.
+
+    Returns:
+        str: 위젯 스타일 시트
+    """
+    # 기본 스타일 - config에서 가져오기 (DRY 원칙)
+    bg_color = config.COLORS['card']
+    border_color = config.COLORS['border_strong']
+    drag_handle_color = config.COLORS['text_disabled']
+
+    style_sheet = f"""
+    QWidget#todoItem {{
+        background: transparent;
+        border: none;
+    }}
+
+    QWidget#todoItemMain {{
+        background: {bg_color};
+        border: {config.UI_METRICS['border_width']['thin']}px solid {border_color};
+        border-radius: {config.UI_METRICS['border_radius']['lg']}px;
+    }}
+
+    QWidget#todoItemMain:hover {{
+        background: {config.COLORS['card_hover']};
+        border-color: {config.COLORS['accent']};
+    }}
+
+    QWidget#subtasksContainer {{
+        background: transparent;
+        border: none;
+    }}
+
+    QLabel#dragHandle {{
+        color: {drag_handle_color};
+        font-size: {config.FONT_SIZES['lg']}px;
+    }}
+
+    QCheckBox#todoCheckbox {{
+        width: {config.WIDGET_SIZES['checkbox_size'][0]}px;
+        height: {config.WIDGET_SIZES['checkbox_size'][1]}px;
+        border: {config.UI_METRICS['border_width']['medium']}px solid {config.COLORS['border']};
+        border-radius: {config.UI_METRICS['border_radius']['sm']}px;
+        background: transparent;
+    }}
+
+    QCheckBox#todoCheckbox:hover {{
+        border-color: {config.COLORS['accent']};
+    }}
+
+    QCheckBox#todoCheckbox:checked {{
+        background: {config.COLORS['accent']};
+        border-color: {config.COLORS['accent']};
+    }}
+
+    QCheckBox#todoCheckbox::indicator {{
+        width: {config.WIDGET_SIZES['checkbox_size'][0] - 4}px;
+        height: {config.WIDGET_SIZES['checkbox_size'][1] - 4}px;
+    }}
+
+    QCheckBox#todoCheckbox::indicator:checked {{
+        image: none;
+    }}
+
+    QLabel#todoText {{
+        color: {config.COLORS['text_primary']};
+        font-size: {config.FONT_SIZES['base']}px;
+        line-height: 1.4;
+        text-decoration: none;
+    }}
+
+    QLabel#todoText[completed="true"] {{
+        color: {config.COLORS['text_disabled']};
+        text-decoration: line-through;
+    }}
+
+    QPushButton#deleteBtn {{
+        background: transparent;
+        border: none;
+        color: {config.COLORS['text_disabled']};
+        font-size: {config.FONT_SIZES['lg']}px;
+        padding: {config.UI_METRICS['padding']['sm'][0]}px {config.UI_METRICS['padding']['sm'][1]}px;
+        border-radius: {config.UI_METRICS['border_radius']['sm']}px;
+    }}
+
+    QPushButton#deleteBtn:hover {{
+        background: rgba(244, 67, 54, 0.15);
+        color: #ef5350;
+    }}
+
+    QPushButton#textExpandBtn {{
+        background: transparent;
+        border: none;
+        color: {config.COLORS['text_disabled']};
+        font-size: 10px;
+        padding: 0;
+    }}
+
+    QPushButton#textExpandBtn:hover {{
+        color: {config.COLORS['accent']};
+    }}
+
+    QPushButton#expandBtn {{
+        background: transparent;
+        border: none;
+        color: {config.COLORS['text_secondary']};
+        font-size: {config.FONT_SIZES['sm']}px;
+        padding: 0px;
+    }}
+
+    QPushButton#expandBtn:hover {{
+        color: {config.COLORS['accent']};
+    }}
+
+    QLabel#recurrenceIcon {{
+        color: {config.COLORS['accent']};
+        font-size: {config.FONT_SIZES['base']}px;
+        padding: 0px 2px;
+    }}
+
+    QLabel#dateBadge {{
+        font-size: {config.FONT_SIZES['sm']}px;
+        padding: {config.UI_METRICS['padding']['sm'][0]}px {config.UI_METRICS['padding']['sm'][1]}px;
+        border-radius: {config.UI_METRICS['border_radius']['sm']}px;
+        font-weight: 500;
+    }}
+
+    QLabel#dateBadge[status="overdue_severe"] {{
+        background: {config.DUE_DATE_COLORS['overdue_severe']['bg']};
+        color: {config.DUE_DATE_COLORS['overdue_severe']['color']};
+    }}
+
+    QLabel#dateBadge[status="overdue_moderate"] {{
+        background: {config.DUE_DATE_COLORS['overdue_moderate']['bg']};
+        color: {config.DUE_DATE_COLORS['overdue_moderate']['color']};
+    }}
+
+    QLabel#dateBadge[status="overdue_mild"] {{
+        background: {config.DUE_DATE_COLORS['overdue_mild']['bg']};
+        color: {config.DUE_DATE_COLORS['overdue_mild']['color']};
+    }}
+
+    QLabel#dateBadge[status="today"] {{
+        background: {config.DUE_DATE_COLORS['today']['bg']};
+        color: {config.DUE_DATE_COLORS['today']['color']};
+    }}
+
+    QLabel#dateBadge[status="upcoming"] {{
+        background: {config.DUE_DATE_COLORS['upcoming']['bg']};
+        color: {config.DUE_DATE_COLORS['upcoming']['color']};
+    }}
+
+    QLabel#dateBadge[status="normal"] {{
+        background: {config.DUE_DATE_COLORS['normal']['bg']};
+        color: {config.DUE_DATE_COLORS['normal']['color']};
+    }}
+    """
+
+    return style_sheet
+
 
 class TodoItemWidget(QWidget, DraggableMixin):
     """TODO 아이템 위젯
@@ -73,6 +269,10 @@ class TodoItemWidget(QWidget, DraggableMixin):
         self.todo = todo
         self._is_hovered = False
         self._subtasks_expanded = False  # 하위 할일 펼침 상태
+        self._effects_completed = None  # opacity 효과가 적용된 완료 상태 (None: 미적용)
+
+        # 표시 내용 스냅샷 (목록 갱신 시 위젯 재사용 여부 판단용)
+        self.render_key = self.build_render_key(todo)
 
         # DraggableMixin 초기화
         self.setup_draggable()
@@ -81,6 +281,36 @@ class TodoItemWidget(QWidget, DraggableMixin):
         self.apply_styles()
         self.connect_signals()
 
+    @staticmethod
+    def build_render_key(todo: Todo) -> tuple:
+        """위젯 표시 내용을 결정하는 값들의 스냅샷 생성
+
+        키가 같으면 기존 위젯을 그대로 재사용할 수 있습니다.
+        납기일은 표시 텍스트/상태로 비교하므로 날짜가 바뀌면 다시 생성됩니다.
+
+        Args:
+            todo: Todo Entity
+
+        Returns:
+            tuple: 비교 가능한 표시 상태 튜플
+        """
+        def due_date_key(due_date):
+            if not due_date:
+                return None
+            return due_date.display_info()
+
+        return (
+            str(todo.content),
+            todo.completed,
+            todo.text_expanded,
+            str(todo.recurrence) if todo.recurrence else None,
+            due_date_key(todo.due_date),
+            tuple(
+                (str(st.id), str(st.content), st.completed, st.text_expanded, due_date_key(st.due_date))
+                for st in todo.subtasks
+            ),
+        )
+
     def setup_ui(self) -> None:
         """UI 요소 생성 및 배치"""
         # 전체 레이아웃 (수직) - 메인 콘텐츠 + 하위 할일 컨테이너
@@ -228,8 +458,8 @@ class TodoItemWidget(QWidget, DraggableMixin):
         self.main_widget.setAcceptDrops(True)
         self.main_widget.installEventFilter(self)
 
-        # 하위 할일 위젯 생성
-        self._populate_subtasks()
+        # 하위 할일 위젯은 처음 펼칠 때 생성 (접힌 항목은 위젯을 만들지 않음)
+        self._subtasks_populated = False
 
         # 초기 상태: 접힌 상태
         self.subtasks_container.setVisible(False)
@@ -278,15 +508,19 @@ class TodoItemWidget(QWidget, DraggableMixin):
         if not self.todo.due_date:
             return ("", "normal")
 
-        # DueDate Value Object 메서드 활용
-        status = self.todo.due_date.calculate_status()
-        text = self.todo.due_date.format_display_text()
+        # DueDate Value Object 메서드 활용 (현재 시각 1회 조회)
+        return self.todo.due_date.display_info()
 
-        return (text, status)
 
+    def _ensure_subtasks_populated(self) -> None:
+        """하위 할일 위젯이 아직 없으면 생성 (펼칠 때 호출)"""
+        if not self._subtasks_populated:
+            self._populate_subtasks()
 
     def _populate_subtasks(self) -> None:
         """하위 할일 위젯들을 생성하여 컨테이너에 추가"""
+        self._subtasks_populated = True
+
         # 기존 위젯들 모두 제거
         while self.subtasks_layout.count():
             item = self.subtasks_layout.takeAt(0)
@@ -311,7 +545,7 @@ class TodoItemWidget(QWidget, DraggableMixin):
         """
         text = str(self.todo.content)
         # \n, \r, <br>, <br/>, <br /> 체크
-        return bool(re.search(r'[\n\r]|<br\s*/?>', text, re.IGNORECASE))
+        return bool(MULTILINE_PATTERN.search(text))
 
     def _toggle_text_expand(self) -> None:
         """텍스트 펼침/접힘 토글"""
@@ -335,12 +569,17 @@ class TodoItemWidget(QWidget, DraggableMixin):
         if self.parent():
             self.parent().updateGeometry()
 
+        # 위젯이 이미 새 상태를 표시하므로 스냅샷 갱신
+        self.render_key = self.build_render_key(self.todo)
+
         # 시그널 발생 (상태 저장용)
         self.text_expanded_changed.emit(str(self.todo.id), self.todo.text_expanded)
 
     def _toggle_subtasks(self) -> None:
         """하위 할일 컨테이너 펼치기/접기"""
         self._subtasks_expanded = not self._subtasks_expanded
+        if self._subtasks_expanded:
+            self._ensure_subtasks_populated()
         self.subtasks_container.setVisible(self._subtasks_expanded)
 
         # 버튼 아이콘 변경
@@ -366,163 +605,22 @@ class TodoItemWidget(QWidget, DraggableMixin):
 
     def _on_subtask_text_expanded_changed(self, parent_id, subtask_id, expanded) -> None:
         """하위 할일 텍스트 펼침 상태 변경 시그널 전파"""
+        # 하위 할일 위젯이 이미 새 상태를 표시하므로 스냅샷 갱신
+        self.render_key = self.build_render_key(self.todo)
         self.subtask_text_expanded_changed.emit(parent_id, subtask_id, expanded)
 
     def apply_styles(self) -> None:
         """QSS 스타일 적용 (프로토타입 정확히 재현)"""
 
-        # 기본 스타일 - config에서 가져오기 (DRY 원칙)
-        bg_color = config.COLORS['card']
-        border_color = config.COLORS['border_strong']
-        drag_handle_color = config.COLORS['text_disabled']
-
-        # 완료 상태에 따른 텍스트 스타일
-        text_decoration = "line-through" if self.todo.completed else "none"
-        text_color = config.COLORS['text_disabled'] if self.todo.completed else config.COLORS['text_primary']
-
-        style_sheet = f"""
-        QWidget#todoItem {{
-            background: transparent;
-            border: none;
-        }}
-
-        QWidget#todoItemMain {{
-            background: {bg_color};
-            border: {config.UI_METRICS['border_width']['thin']}px solid {border_color};
-            border-radius: {config.UI_METRICS['border_radius']['lg']}px;
-        }}
-
-        QWidget#todoItemMain:hover {{
-            background: {config.COLORS['card_hover']};
-            border-color: {config.COLORS['accent']};
-        }}
-
-        QWidget#subtasksContainer {{
-            background: transparent;
-            border: none;
-        }}
-
-        QLabel#dragHandle {{
-            color: {drag_handle_color};
-            font-size: {config.FONT_SIZES['lg']}px;
-        }}
-
-        QCheckBox#todoCheckbox {{
-            width: {config.WIDGET_SIZES['checkbox_size'][0]}px;
-            height: {config.WIDGET_SIZES['checkbox_size'][1]}px;
-            border: {config.UI_METRICS['border_width']['medium']}px solid {config.COLORS['border']};
-            border-radius: {config.UI_METRICS['border_radius']['sm']}px;
-            background: transparent;
-        }}
-
-        QCheckBox#todoCheckbox:hover {{
-            border-color: {config.COLORS['accent']};
-        }}
-
-        QCheckBox#todoCheckbox:checked {{
-            background: {config.COLORS['accent']};
-            border-color: {config.COLORS['accent']};
-        }}
-
-        QCheckBox#todoCheckbox::indicator {{
-            width: {config.WIDGET_SIZES['checkbox_size'][0] - 4}px;
-            height: {config.WIDGET_SIZES['checkbox_size'][1] - 4}px;
-        }}
-
-        QCheckBox#todoCheckbox::indicator:checked {{
-            image: none;
-        }}
-
-        QLabel#todoText {{
-            color: {text_color};
-            font-size: {config.FONT_SIZES['base']}px;
-            line-height: 1.4;
-            text-decoration: {text_decoration};
-        }}
-
-        QPushButton#deleteBtn {{
-            background: transparent;
-            border: none;
-            color: {config.COLORS['text_disabled']};
-            font-size: {config.FONT_SIZES['lg']}px;
-            padding: {config.UI_METRICS['padding']['sm'][0]}px {config.UI_METRICS['padding']['sm'][1]}px;
-            border-radius: {config.UI_METRICS['border_radius']['sm']}px;
-        }}
-
-        QPushButton#deleteBtn:hover {{
-            background: rgba(244, 67, 54, 0.15);
-            color: #ef5350;
-        }}
-
-        QPushButton#textExpandBtn {{
-            background: transparent;
-            border: none;
-            color: {config.COLORS['text_disabled']};
-            font-size: 10px;
-            padding: 0;
-        }}
-
-        QPushButton#textExpandBtn:hover {{
-            color: {config.COLORS['accent']};
-        }}
-
-        QPushButton#expandBtn {{
-            background: transparent;
-            border: none;
-            color: {config.COLORS['text_secondary']};
-            font-size: {config.FONT_SIZES['sm']}px;
-            padding: 0px;
-        }}
-
-        QPushButton#expandBtn:hover {{
-            color: {config.COLORS['accent']};
-        }}
-
-        QLabel#recurrenceIcon {{
-            color: {config.COLORS['accent']};
-            font-size: {config.FONT_SIZES['base']}px;
-            padding: 0px 2px;
-        }}
-
-        QLabel#dateBadge {{
-            font-size: {config.FONT_SIZES['sm']}px;
-            padding: {config.UI_METRICS['padding']['sm'][0]}px {config.UI_METRICS['padding']['sm'][1]}px;
-            border-radius: {config.UI_METRICS['border_radius']['sm']}px;
-            font-weight: 500;
-        }}
-
-        QLabel#dateBadge[status="overdue_severe"] {{
-            background: {config.DUE_DATE_COLORS['overdue_severe']['bg']};
-            color: {config.DUE_DATE_COLORS['overdue_severe']['color']};
-        }}
-
-        QLabel#dateBadge[status="overdue_moderate"] {{
-            background: {config.DUE_DATE_COLORS['overdue_moderate']['bg']};
-            color: {config.DUE_DATE_COLORS['overdue_moderate']['color']};
-        }}
-
-        QLabel#dateBadge[status="overdue_mild"] {{
-            background: {config.DUE_DATE_COLORS['overdue_mild']['bg']};
-            color: {config.DUE_DATE_COLORS['overdue_mild']['color']};
-        }}
-
-        QLabel#dateBadge[status="today"] {{
-            background: {config.DUE_DATE_COLORS['today']['bg']};
-            color: {config.DUE_DATE_COLORS['today']['color']};
-        }}
-
-        QLabel#dateBadge[status="upcoming"] {{
-            background: {config.DUE_DATE_COLORS['upcoming']['bg']};
-            color: {config.DUE_DATE_COLORS['upcoming']['color']};
-        }}
-
-        QLabel#dateBadge[status="normal"] {{
-            background: {config.DUE_DATE_COLORS['normal']['bg']};
-            color: {config.DUE_DATE_COLORS['normal']['color']};
-        }}
-        """
+        # 캐시된 스타일 시트 재사용, 동일하면 재적용 생략
+        style_sheet = _build_style_sheet()
+        if self.styleSheet() != style_sheet:
+            self.setStyleSheet(style_sheet)
 
-        self.setStyleSheet(style_sheet)
+        # 완료 상태가 그대로면 opacity 효과 재생성 생략 (드래그 종료 후 재적용 등)
+        if self._effects_completed == self.todo.completed:
+            return
+        self._effects_completed = self.todo.completed
 
         # 완료 상태면 개별 요소에만 opacity 효과 적용 (X버튼 제외)
         if self.todo.completed:
@@ -621,9 +719,11 @@ class TodoItemWidget(QWidget, DraggableMixin):
         Args:
             event: 이벤트 객체
         """
-        self._is_hovered = True
-        # Opacity로 부드럽게 표시
-        self.delete_btn_opacity.setOpacity(config.OPACITY_VALUES['visible'])
+        # 이미 호버 상태면 opacity 재설정(재페인트) 생략
+        if not self._is_hovered:
+            self._is_hovered = True
+            # Opacity로 부드럽게 표시
+            self.delete_btn_opacity.setOpacity(config.OPACITY_VALUES['visible'])
         super().enterEvent(event)
 
     def leaveEvent(self, event) -> None:
@@ -632,9 +732,10 @@ class TodoItemWidget(QWidget, DraggableMixin):
         Args:
             event: 이벤트 객체
         """
-        self._is_hovered = False
-        # Opacity로 부드럽게 숨김
-        self.delete_btn_opacity.setOpacity(config.OPACITY_VALUES['hidden'])
+        if self._is_hovered:
+            self._is_hovered = False
+            # Opacity로 부드럽게 숨김
+            self.delete_btn_opacity.setOpacity(config.OPACITY_VALUES['hidden'])
         super().leaveEvent(event)
 
     def _update_completion_style(self) -> None:
@@ -644,11 +745,13 @@ class TodoItemWidget(QWidget, DraggableMixin):
         else:
             self.todo_text.setProperty("completed", "false")
 
-        # 스타일 재적용
+        # 텍스트 라벨만 다시 polish (링크 파싱/전체 스타일 시트 재적용 없음)
+        self.style().unpolish(self.todo_text)
+        self.style().polish(self.todo_text)
+        self.todo_text.update()
+
+        # 완료 상태 opacity 효과 갱신
         self.apply_styles()
-        self.style().unpolish(self)
-        self.style().polish(self)
-        self.update()
 
     def set_expanded(self, expanded: bool) -> None:
         """외부에서 펼침 상태 설정 (reload 후 복원용)
@@ -660,6 +763,8 @@ class TodoItemWidget(QWidget, DraggableMixin):
             return
 
         self._subtasks_expanded = expanded
+        if expanded:
+            self._ensure_subtasks_populated()
         self.subtasks_container.setVisible(expanded)
         self.expand_btn.setText("▼" if expanded else "▶")
 
@@ -689,19 +794,24 @@ class TodoItemWidget(QWidget, DraggableMixin):
         Returns:
             bool: 이벤트 처리 여부
         """
+        # 페인트/마우스 이동/호버 등 드래그 앤 드롭 외 이벤트는 바로 통과
+        event_type = event.type()
+        if event_type not in DRAG_DROP_EVENT_TYPES:
+            return False
+
         if obj == self.subtasks_container:
-            if event.type() == event.Type.DragEnter:
+            if event_type == QEvent.Type.DragEnter:
                 return self._handle_drag_enter(event)
-            elif event.type() == event.Type.DragMove:
+            elif event_type == QEvent.Type.DragMove:
                 return self._handle_drag_move(event)
-            elif event.type() == event.Type.Drop:
+            else:
                 return self._handle_drop(event)
         elif obj == self.main_widget:
-            if event.type() == event.Type.DragEnter:
+            if event_type == QEvent.Type.DragEnter:
                 return self._handle_main_drag_enter(event)
-            elif event.type() == event.Type.DragMove:
+            elif event_type == QEvent.Type.DragMove:
                 return self._handle_main_drag_move(event)
-            elif event.type() == event.Type.Drop:
+            else:
                 return self._handle_main_drop(event)
         return super().eventFilter(obj, event)
 
@@ -715,13 +825,10 @@ class TodoItemWidget(QWidget, DraggableMixin):
             bool: 이벤트 처리 여부
         """
         if event.mimeData().hasText():
-            try:
-                data = json.loads(event.mimeData().text())
-                if data.get('type') == 'subtask':
-                    event.acceptProposedAction()
-                    return True
-            except (json.JSONDecodeError, KeyError):
-                pass
+            data = _parse_drag_payload(event.mimeData().text())
+            if data and data.get('type') == 'subtask':
+                event.acceptProposedAction()
+                return True
         event.ignore()
         return True
 
@@ -735,13 +842,10 @@ class TodoItemWidget(QWidget, DraggableMixin):
             bool: 이벤트 처리 여부
         """
         if event.mimeData().hasText():
-            try:
-                data = json.loads(event.mimeData().text())
-                if data.get('type') == 'subtask':
-                    event.acceptProposedAction()
-                    return True
-            except (json.JSONDecodeError, KeyError):
-                pass
+            data = _parse_drag_payload(event.mimeData().text())
+            if data and data.get('type') == 'subtask':
+                event.acceptProposedAction()
+                return True
         event.ignore()
         return True
 
@@ -754,9 +858,6 @@ class TodoItemWidget(QWidget, DraggableMixin):
         Returns:
             bool: 이벤트 처리 여부
         """
-        import logging
-        logger = logging.getLogger(__name__)
-
         if not event.mimeData().hasText():
             event.ignore()
             return True
@@ -838,34 +939,25 @@ class TodoItemWidget(QWidget, DraggableMixin):
     def _handle_main_drag_enter(self, event) -> bool:
         """메인 위젯 드래그 진입 이벤트 (다른 부모의 하위 할일 수락)"""
         if event.mimeData().hasText():
-            try:
-                data = json.loads(event.mimeData().text())
-                if data.get('type') == 'subtask' and data.get('parent_todo_id') != str(self.todo.id):
-                    event.acceptProposedAction()
-                    return True
-            except (json.JSONDecodeError, KeyError):
-                pass
+            data = _parse_drag_payload(event.mimeData().text())
+            if data and data.get('type') == 'subtask' and data.get('parent_todo_id') != str(self.todo.id):
+                event.acceptProposedAction()
+                return True
         event.ignore()
         return True
 
     def _handle_main_drag_move(self, event) -> bool:
         """메인 위젯 드래그 이동 이벤트 (다른 부모의 하위 할일 수락)"""
         if event.mimeData().hasText():
-            try:
-                data = json.loads(event.mimeData().text())
-                if data.get('type') == 'subtask' and data.get('parent_todo_id') != str(self.todo.id):
-                    event.acceptProposedAction()
-                    return True
-            except (json.JSONDecodeError, KeyError):
-                pass
+            data = _parse_drag_payload(event.mimeData().text())
+            if data and data.get('type') == 'subtask' and data.get('parent_todo_id') != str(self.todo.id):
+                event.acceptProposedAction()
+                return True
         event.ignore()
         return True
 
     def _handle_main_drop(self, event) -> bool:
         """메인 위젯 드롭 이벤트 (하위 할일을 이 메인 할일의 마지막 하위로 이동)"""
-        import logging
-        logger = logging.getLogger(__name__)
-
         if not event.mimeData().hasText():
             event.ignore()
             return True
@@ -953,8 +1045,11 @@ class TodoItemWidget(QWidget, DraggableMixin):
                 # 날짜 배지가 있었는데 제거된 경우
                 self.date_badge.setVisible(False)
 
-        # 하위 할일 업데이트
-        self._populate_subtasks()
+        # 하위 할일 업데이트 (접혀 있으면 다음 펼칠 때 다시 생성)
+        if was_expanded:
+            self._populate_subtasks()
+        else:
+            self._subtasks_populated = False
 
         # 펼치기 버튼 표시 여부 및 펼침 상태 복원 (P3-3)
         if len(self.todo.subtasks) > 0:
@@ -976,4 +1071,9 @@ class TodoItemWidget(QWidget, DraggableMixin):
             self._subtasks_expanded = False
             self.subtasks_container.setVisible(False)
 
+        # 날짜 배지 등이 바뀌었을 수 있으므로 opacity 효과 다시 적용
+        self._effects_completed = None
         self.apply_styles()
+
+        # 위젯이 새 Todo를 표시하므로 스냅샷 갱신
+        self.render_key = self.build_render_key(self.todo)